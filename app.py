@@ -1,19 +1,22 @@
 from fastapi import FastAPI, Request, Body
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 import uvicorn
 from pathlib import Path
+import os
 import asyncio
+import orjson
 import uuid
 from datetime import datetime, timedelta
 
 from database import Neo4jConnection
-from social_balance import SocialBalanceModel
+from social_balance import SocialBalanceModel, SimulationHistory
 from models.factory import ModelFactory
 
-app = FastAPI(title="Social Balance Graph Viewer")
+# orjson keeps serialization of large graph payloads and histories off the hot path
+app = FastAPI(title="Social Balance Graph Viewer", default_response_class=ORJSONResponse)
 
 # Setup templates and static files
 templates = Jinja2Templates(directory="templates")
@@ -39,6 +42,12 @@ class SimulationRequest(BaseModel):
 # Initialize database connection
 db = Neo4jConnection()
 
+# Optional seed making runs reproducible (unset = a fresh run every time)
+SIMULATION_SEED = os.getenv("SIMULATION_SEED")
+
+# Opt in to decaying every relationship at the end of each iteration
+SIMULATION_APPLY_DECAY = os.getenv("SIMULATION_APPLY_DECAY", "false").lower() == "true"
+
 # Create model with configured strategies from factory
 model_components = ModelFactory.create_from_config()
 model = SocialBalanceModel(
@@ -46,17 +55,31 @@ model = SocialBalanceModel(
     balance_rule=model_components['balance_rule'],
     action_strategy=model_components['action_strategy'],
     relationship_type=model_components['relationship_type'],
-    decay=model_components['decay']
+    decay=model_components['decay'],
+    seed=int(SIMULATION_SEED) if SIMULATION_SEED else None,
+    apply_decay_each_iteration=SIMULATION_APPLY_DECAY
 )
 
+# Model info shown on the index page never changes while the app is running
+MODEL_INFO = {
+    "balance_rule": model.balance_rule.get_name(),
+    "action_strategy": model.action_strategy.get_name(),
+    "relationship_type": model.relationship_type.get_name(),
+    "decay": model.decay.get_name()
+}
+
 # Print model configuration on startup
 print("=" * 60)
-print(ModelFactory.get_model_description())
+print(ModelFactory.get_model_description(components=model_components))
 print("=" * 60)
 
 # Track running simulations
 running_simulations = {}
 
+# Optional pause between background simulation iterations (seconds), e.g. to slow
+# runs down while debugging; 0 just yields to the event loop
+SIMULATION_STEP_DELAY = float(os.getenv("SIMULATION_STEP_DELAY", "0"))
+
 
 @app.on_event("startup")
 async def startup_event():
@@ -73,16 +96,9 @@ async def shutdown_event():
 @app.get("/", response_class=HTMLResponse)
 async def index(request: Request):
     """Render main page"""
-    # Get model description for display
-    model_info = {
-        "balance_rule": model.balance_rule.get_name(),
-        "action_strategy": model.action_strategy.get_name(),
-        "relationship_type": model.relationship_type.get_name(),
-        "decay": model.decay.get_name()
-    }
     return templates.TemplateResponse("index.html", {
         "request": request,
-        "model_info": model_info
+        "model_info": MODEL_INFO
     })
 
 
@@ -135,24 +151,33 @@ async def run_iteration(request: IterationRequest):
 @app.post("/api/simulate/start")
 async def start_simulation(request: SimulationRequest):
     """Start an asynchronous simulation"""
+    sim_id = _launch_simulation(request.max_iterations, request.action_probability)
+    return {"simulation_id": sim_id, "status": "started"}
+
+
+def _launch_simulation(max_iterations: int, action_probability: float, timeout: int = 300):
+    """Register a simulation and start it as a background task; returns its id"""
     sim_id = str(uuid.uuid4())
 
     # Store simulation state
     running_simulations[sim_id] = {
         "status": "running",
         "current_iteration": 0,
-        "max_iterations": request.max_iterations,
-        "action_probability": request.action_probability,
+        "max_iterations": max_iterations,
+        "action_probability": action_probability,
         "result": None,
         "error": None,
         "started_at": datetime.now(),
-        "timeout": 300  # 5 minutes timeout
+        "timeout": timeout,  # 5 minutes by default
+        "snapshot": None,  # Latest status published to SSE subscribers
+        "updated": asyncio.Event()  # Set (and replaced) whenever a new snapshot is published
     }
 
-    # Start simulation in background
-    asyncio.create_task(run_simulation_async(sim_id, request.max_iterations, request.action_probability))
+    # Start simulation in background; the task is kept so callers can wait for it to wind down
+    running_simulations[sim_id]["task"] = asyncio.create_task(
+        run_simulation_async(sim_id, max_iterations, action_probability))
 
-    return {"simulation_id": sim_id, "status": "started"}
+    return sim_id
 
 
 @app.get("/api/simulate/status/{sim_id}")
@@ -168,6 +193,40 @@ async def get_simulation_status(sim_id: str):
         sim["status"] = "timeout"
         sim["error"] = "Simulation timed out after 5 minutes"
 
+    return _simulation_status(sim)
+
+
+@app.get("/api/simulate/events/{sim_id}")
+async def simulation_events(sim_id: str):
+    """Stream simulation progress as Server-Sent Events until it finishes"""
+    sim = running_simulations.get(sim_id)
+    if sim is None:
+        return ORJSONResponse({"error": "Simulation not found"}, status_code=404)
+
+    async def event_stream():
+        # Every subscriber follows the latest snapshot on its own, starting with the
+        # current one, so extra tabs and reconnecting clients all see the final status;
+        # snapshots published while a client is still busy are skipped (latest wins)
+        while True:
+            updated = sim["updated"]
+            status = sim["snapshot"] or _simulation_status(sim)
+            yield b"data: " + orjson.dumps(status) + b"\n\n"
+            if status["status"] != "running":
+                break
+            await updated.wait()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+def _publish_status(sim):
+    """Record the simulation's current status as its latest snapshot and wake all waiters"""
+    sim["snapshot"] = _simulation_status(sim)
+    sim["updated"].set()
+    sim["updated"] = asyncio.Event()
+
+
+def _simulation_status(sim):
+    """Build the client-facing status payload for a simulation"""
     return {
         "status": sim["status"],
         "current_iteration": sim["current_iteration"],
@@ -189,12 +248,16 @@ async def stop_simulation(sim_id: str):
 
 async def run_simulation_async(sim_id: str, max_iterations: int, action_probability: float):
     """Run simulation asynchronously with progress updates"""
+    sim = running_simulations[sim_id]
     try:
-        sim = running_simulations[sim_id]
         iteration_count = 0
-        history = []
+        history = SimulationHistory()
         no_change_streak = 0
 
+        # Statistics are fetched once up front; afterwards each iteration
+        # returns the post-iteration stats, so we never query them twice
+        stats = await model.get_statistics()
+
         for i in range(max_iterations):
             # Check if simulation was stopped or timed out
             if sim["status"] != "running":
@@ -206,13 +269,13 @@ async def run_simulation_async(sim_id: str, max_iterations: int, action_probabil
                 sim["error"] = "Simulation timed out"
                 break
 
-            stats = await model.get_statistics()
             history.append(stats)
 
             # Update progress and current stats every 10 iterations
             sim["current_iteration"] = i
             if i % 10 == 0 or i == 0:
                 sim["current_stats"] = stats
+                _publish_status(sim)
 
             # Check if all triangles are balanced
             if stats["unbalanced_triangles"] == 0 and stats["total_triangles"] > 0:
@@ -220,7 +283,7 @@ async def run_simulation_async(sim_id: str, max_iterations: int, action_probabil
                 sim["result"] = {
                     "iterations": i,
                     "final_stats": stats,
-                    "history": history,
+                    "history": history.to_list(),
                     "converged": True
                 }
                 break
@@ -228,6 +291,7 @@ async def run_simulation_async(sim_id: str, max_iterations: int, action_probabil
             # Run one iteration
             result = await model.run_single_iteration(action_probability)
             iteration_count += 1
+            stats = result["stats"]
 
             # Track consecutive iterations with no changes
             if result["changes_made"] == 0:
@@ -239,98 +303,69 @@ async def run_simulation_async(sim_id: str, max_iterations: int, action_probabil
             # This indicates true stable state (not just random chance)
             if no_change_streak >= 10:
                 sim["status"] = "completed"
-                final_stats = await model.get_statistics()
                 sim["result"] = {
                     "iterations": iteration_count,
-                    "final_stats": final_stats,
-                    "history": history,
-                    "converged": final_stats["unbalanced_triangles"] == 0
+                    "final_stats": stats,
+                    "history": history.to_list(),
+                    "converged": stats["unbalanced_triangles"] == 0
                 }
                 break
 
-            # Small delay to allow other operations and checking stop signal
-            await asyncio.sleep(0.01)
+            # Yield to the event loop so stop requests and other handlers get a turn
+            await asyncio.sleep(SIMULATION_STEP_DELAY)
 
         # If we finished all iterations
         if sim["status"] == "running":
-            final_stats = await model.get_statistics()
             sim["status"] = "completed"
             sim["result"] = {
                 "iterations": iteration_count,
-                "final_stats": final_stats,
-                "history": history,
-                "converged": final_stats["unbalanced_triangles"] == 0
+                "final_stats": stats,
+                "history": history.to_list(),
+                "converged": stats["unbalanced_triangles"] == 0
             }
 
     except Exception as e:
         sim["status"] = "error"
         sim["error"] = str(e)
 
+    finally:
+        # Final snapshot ends the event stream
+        _publish_status(sim)
 
-@app.post("/api/simulate")
-async def run_simulation(request: SimulationRequest):
-    """Legacy endpoint - run complete simulation (with timeout)"""
-    # Use a timeout of 60 seconds for synchronous simulations
-    timeout = 60
-    start_time = datetime.now()
 
-    iteration_count = 0
-    history = []
-    no_change_streak = 0
+@app.post("/api/simulate")
+async def run_simulation(request: SimulationRequest, http_request: Request):
+    """Legacy endpoint - run complete simulation (with timeout) and wait for the result"""
+    # Runs as a regular background simulation with a 60 second timeout; this
+    # handler only waits for it and stops it if the client goes away
+    sim_id = _launch_simulation(request.max_iterations, request.action_probability, timeout=60)
+    sim = running_simulations[sim_id]
 
     try:
-        for i in range(request.max_iterations):
-            # Check timeout
-            if datetime.now() - start_time > timedelta(seconds=timeout):
-                return {
-                    "error": "Simulation timed out after 60 seconds",
-                    "iterations": iteration_count,
-                    "final_stats": await model.get_statistics()
-                }
-
-            stats = await model.get_statistics()
-            history.append(stats)
-
-            # Check if all triangles are balanced
-            if stats["unbalanced_triangles"] == 0 and stats["total_triangles"] > 0:
-                return {
-                    "iterations": i,
-                    "final_stats": stats,
-                    "history": history,
-                    "converged": True
-                }
-
-            # Run one iteration
-            result = await model.run_single_iteration(request.action_probability)
-            iteration_count += 1
-
-            # Track consecutive iterations with no changes
-            if result["changes_made"] == 0:
-                no_change_streak += 1
-            else:
-                no_change_streak = 0
-
-            # Only stop if no changes for 10 consecutive iterations
-            if no_change_streak >= 10:
-                final_stats = await model.get_statistics()
-                return {
-                    "iterations": iteration_count,
-                    "final_stats": final_stats,
-                    "history": history,
-                    "converged": final_stats["unbalanced_triangles"] == 0
-                }
-
-        # Finished all iterations
-        final_stats = await model.get_statistics()
-        return {
-            "iterations": iteration_count,
-            "final_stats": final_stats,
-            "history": history,
-            "converged": final_stats["unbalanced_triangles"] == 0
-        }
+        while sim["status"] == "running":
+            try:
+                await asyncio.wait_for(sim["updated"].wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+            if await http_request.is_disconnected():
+                sim["status"] = "stopped"
+                return {"error": "Client disconnected"}
+
+        if sim["status"] == "completed":
+            return sim["result"]
+        if sim["status"] in ("timeout", "stopped"):
+            # Let the background run finish its current iteration so the stats are final
+            await sim["task"]
+            return {
+                "error": ("Simulation timed out after 60 seconds" if sim["status"] == "timeout"
+                          else "Simulation stopped"),
+                "iterations": sim["current_iteration"],
+                "final_stats": await model.get_statistics()
+            }
+        return {"error": sim["error"]}
 
-    except Exception as e:
-        return {"error": str(e)}
+    finally:
+        running_simulations.pop(sim_id, None)
 
 
 @app.get("/api/stats")
@@ -348,4 +383,13 @@ async def reset_graph():
 
 
 if __name__ == "__main__":
-    uvicorn.run("app:app", host="0.0.0.0", port=5000, reload=True)
+    # APP_RELOAD=false for production. Simulation status and the model's graph copy
+    # live in-process and assume a single writer, so only one worker is supported
+    reload = os.getenv("APP_RELOAD", "true").lower() == "true"
+    workers = None if reload else int(os.getenv("APP_WORKERS", "1"))
+    if workers is not None and workers > 1:
+        raise SystemExit("APP_WORKERS > 1 is not supported: each worker would keep its own, "
+                         "diverging copy of the graph")
+    # "auto" picks uvloop/httptools when they are installed and falls back to asyncio/h11
+    uvicorn.run("app:app", host="0.0.0.0", port=5000, reload=reload, workers=workers,
+                loop="auto", http="auto")
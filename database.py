@@ -1,4 +1,4 @@
-from neo4j import AsyncGraphDatabase
+from neo4j import AsyncGraphDatabase, RoutingControl
 import os
 from dotenv import load_dotenv
 
@@ -12,6 +12,11 @@ class Neo4jConnection:
         self.uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.user = os.getenv("NEO4J_USER", "neo4j")
         self.password = os.getenv("NEO4J_PASSWORD", "password")
+        self.database = os.getenv("NEO4J_DATABASE", "neo4j")
+        # Connection pool tuning (concurrent simulations + stats polling share one pool)
+        self.max_connection_pool_size = int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE", "100"))
+        self.connection_acquisition_timeout = float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT", "60"))
+        self.max_connection_lifetime = float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
         self.driver = None
 
     async def connect(self):
@@ -19,15 +24,25 @@ class Neo4jConnection:
         try:
             self.driver = AsyncGraphDatabase.driver(
                 self.uri,
-                auth=(self.user, self.password)
+                auth=(self.user, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                max_connection_lifetime=self.max_connection_lifetime,
+                keep_alive=True
             )
             # Test connection
             await self.driver.verify_connectivity()
             print(f"Connected to Neo4j at {self.uri}")
+            await self.create_indexes()
         except Exception as e:
             print(f"Failed to connect to Neo4j: {e}")
             raise
 
+    async def create_indexes(self):
+        """Create indexes used by person lookups and relationship type filters"""
+        await self.execute_write("CREATE INDEX person_id_idx IF NOT EXISTS FOR (p:Person) ON (p.id)")
+        await self.execute_write("CREATE INDEX rel_type_idx IF NOT EXISTS FOR ()-[r:RELATION]-() ON (r.type)")
+
     async def close(self):
         """Close database connection"""
         if self.driver:
@@ -36,37 +51,36 @@ class Neo4jConnection:
 
     async def execute_query(self, query, parameters=None):
         """Execute a Cypher query and return results"""
-        async with self.driver.session() as session:
-            result = await session.run(query, parameters or {})
-            records = []
-            async for record in result:
-                # Convert Neo4j objects to dictionaries
-                data = {}
-                for key in record.keys():
-                    value = record[key]
-                    # Convert Node objects to dicts
-                    if hasattr(value, '__class__') and value.__class__.__name__ == 'Node':
-                        data[key] = dict(value)
-                    # Convert Relationship objects to dicts
-                    elif hasattr(value, '__class__') and value.__class__.__name__ == 'Relationship':
-                        data[key] = dict(value)
-                    else:
-                        data[key] = value
-                records.append(data)
-            return records
+        # Queries project plain values/maps server-side, so records are already dict-ready
+        records, _, _ = await self.driver.execute_query(
+            query, parameters or {},
+            database_=self.database,
+            routing_=RoutingControl.READ
+        )
+        return [record.data() for record in records]
 
-    async def execute_write(self, query, parameters=None):
-        """Execute a write query with proper transaction management"""
-        async def _tx_function(tx):
-            result = await tx.run(query, parameters or {})
-            summary = await result.consume()
-            return summary.counters
+    def _write_session(self):
+        """
+        Session for multi-statement write transactions.
+
+        Shares the bookmark manager used by driver.execute_query, so reads issued
+        through execute_query are causally chained after these writes.
+        """
+        return self.driver.session(
+            database=self.database,
+            bookmark_manager=self.driver.execute_query_bookmark_manager
+        )
 
+    async def execute_write(self, query, parameters=None):
+        """Execute a write query in a driver-managed transaction"""
         print(f"[DB] Executing write query...")
-        async with self.driver.session() as session:
-            counters = await session.execute_write(_tx_function)
-            print(f"[DB] Write query completed")
-            return counters
+        _, summary, _ = await self.driver.execute_query(
+            query, parameters or {},
+            database_=self.database,
+            routing_=RoutingControl.WRITE
+        )
+        print(f"[DB] Write query completed")
+        return summary.counters
 
     async def clear_database(self):
         """Delete all nodes and relationships"""
@@ -85,6 +99,42 @@ class Neo4jConnection:
         }
         return await self.execute_write(query, parameters)
 
+    async def initialize_graph_batch(self, person_ids, relationships):
+        """
+        Create all person nodes and relationships in a single write transaction.
+
+        Args:
+            person_ids: list of person ids to create
+            relationships: list of dicts with keys: person1_id, person2_id, rel_type, value, initial_value (optional)
+        """
+        people = [{"id": pid, "name": f"Person_{pid}"} for pid in person_ids]
+        for rel in relationships:
+            if 'initial_value' not in rel:
+                rel['initial_value'] = rel['value']
+
+        people_query = """
+        UNWIND $people AS p
+        CREATE (:Person {id: p.id, name: p.name})
+        """
+        relationships_query = """
+        UNWIND $relationships AS rel
+        MATCH (p1:Person {id: rel.person1_id})
+        MATCH (p2:Person {id: rel.person2_id})
+        CREATE (p1)-[:RELATION {type: rel.rel_type, value: rel.value, initial_value: rel.initial_value}]->(p2)
+        """
+
+        async def _tx_function(tx):
+            result = await tx.run(people_query, {"people": people})
+            await result.consume()
+            if relationships:
+                result = await tx.run(relationships_query, {"relationships": relationships})
+                await result.consume()
+
+        print(f"[DB] Creating {len(people)} people and {len(relationships)} relationships in one transaction...")
+        async with self._write_session() as session:
+            await session.execute_write(_tx_function)
+        print(f"[DB] Graph batch creation completed")
+
     async def create_relationship(self, person1_id, person2_id, rel_type, value=None, initial_value=None):
         """
         Create a relationship between two people
@@ -153,6 +203,46 @@ class Neo4jConnection:
         }
         return await self.execute_write(query, parameters)
 
+    async def apply_relationship_changes(self, changes):
+        """
+        Apply relationship deletes, updates and creates in a single write transaction.
+
+        Args:
+            changes: list of dicts with keys: op ('delete', 'update' or 'create'), person1_id, person2_id,
+                     and for update/create also rel_type and value. At most one change per pair.
+        """
+        deletes = [c for c in changes if c["op"] == "delete"]
+        updates = [c for c in changes if c["op"] == "update"]
+        creates = [c for c in changes if c["op"] == "create"]
+
+        delete_query = """
+        UNWIND $changes AS c
+        MATCH (p1:Person {id: c.person1_id})-[r:RELATION]-(p2:Person {id: c.person2_id})
+        DELETE r
+        """
+        update_query = """
+        UNWIND $changes AS c
+        MATCH (p1:Person {id: c.person1_id})-[r:RELATION]-(p2:Person {id: c.person2_id})
+        SET r.type = c.rel_type, r.value = c.value
+        """
+        # MERGE so that two people connecting to each other in the same batch yield one edge
+        create_query = """
+        UNWIND $changes AS c
+        MATCH (p1:Person {id: c.person1_id}), (p2:Person {id: c.person2_id})
+        MERGE (p1)-[r:RELATION]-(p2)
+        ON CREATE SET r.type = c.rel_type, r.value = c.value, r.initial_value = c.value
+        ON MATCH SET r.type = c.rel_type, r.value = c.value
+        """
+
+        async def _tx_function(tx):
+            for query, batch in ((delete_query, deletes), (update_query, updates), (create_query, creates)):
+                if batch:
+                    result = await tx.run(query, {"changes": batch})
+                    await result.consume()
+
+        async with self._write_session() as session:
+            await session.execute_write(_tx_function)
+
     async def delete_relationship(self, person1_id, person2_id):
         """Delete relationship between two people (convert to NEUTRAL)"""
         query = """
@@ -171,7 +261,7 @@ class Neo4jConnection:
         MATCH (p:Person)
         OPTIONAL MATCH (p)-[r:RELATION]-(p2:Person)
         WHERE id(p) < id(p2)
-        RETURN p, r, p2
+        RETURN properties(p) AS p, properties(r) AS r, properties(p2) AS p2
         """
         return await self.execute_query(query)
 
@@ -214,6 +304,27 @@ class Neo4jConnection:
         """
         return await self.execute_query(query, {"person_id": person_id})
 
+    async def get_neighbors_of_neighbors_batch(self, person_ids):
+        """
+        Get neighbors of neighbors (as in get_neighbors_of_neighbors) for several people in one query.
+
+        Returns:
+            dict mapping person id to a list of {"id": ...} records
+            (people without any are absent)
+        """
+        query = """
+        UNWIND $person_ids AS pid
+        MATCH (p:Person {id: pid})-[r1:RELATION]-(neighbor:Person)-[r2:RELATION]-(fof:Person)
+        WHERE fof.id <> pid
+        AND r1.type <> 'NEUTRAL' AND r2.type <> 'NEUTRAL'
+        AND NOT EXISTS((p)-[:RELATION {type: 'POSITIVE'}]-(fof))
+        AND NOT EXISTS((p)-[:RELATION {type: 'NEGATIVE'}]-(fof))
+        WITH pid, collect(DISTINCT fof.id) AS fof_ids
+        RETURN pid as person_id, [fof_id IN fof_ids | {id: fof_id}] as neighbors
+        """
+        result = await self.execute_query(query, {"person_ids": list(person_ids)})
+        return {r["person_id"]: r["neighbors"] for r in result}
+
     async def get_neighbors(self, person_id):
         """Get all direct neighbors of a person (POSITIVE or NEGATIVE relationships only)"""
         query = """
@@ -0,0 +1,270 @@
+"""
+In-process copy of the Person/RELATION graph.
+
+Kept in lockstep with the writes SocialBalanceModel makes so that statistics
+can be computed with NumPy instead of a Cypher triangle pattern match.
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+# Relationship type codes stored in the type matrix (0 = no edge)
+TYPE_CODES = {"POSITIVE": 1, "NEGATIVE": 2, "NEUTRAL": 3}
+TYPE_NAMES = {code: name for name, code in TYPE_CODES.items()}
+
+# Upper bound on the cells of the boolean edge x person mask built per chunk when
+# enumerating triangles (16M cells = 16 MB)
+TRIANGLE_CHUNK_CELLS = 1 << 24
+
+
+@dataclass
+class TriangleBatch:
+    """
+    Triangles as parallel arrays rather than one dict per triangle.
+
+    Row i is the triangle nodes[i], where edges[i, k] is the value of the edge
+    between nodes[i, k] and nodes[i, (k + 1) % 3].
+    """
+
+    nodes: np.ndarray
+    edges: np.ndarray
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def triangle(self, row, person_id=None):
+        """
+        Build the triangle dict (n1..n3, e1..e3) for one row.
+
+        Args:
+            row: Row index
+            person_id: If given, rotate the triangle so that this person is n1,
+                like Neo4jConnection.get_person_triangles does
+        """
+        nodes = self.nodes[row].tolist()
+        edges = self.edges[row].tolist()
+        if person_id is not None:
+            k = nodes.index(person_id)
+            nodes = nodes[k:] + nodes[:k]
+            edges = edges[k:] + edges[:k]
+        return {"n1": nodes[0], "n2": nodes[1], "n3": nodes[2],
+                "e1": edges[0], "e2": edges[1], "e3": edges[2]}
+
+    def rows_by_person(self, rows):
+        """
+        Group the given row indices by the people in each triangle.
+
+        Returns:
+            dict mapping person id to an ascending array of row indices
+            (people in none of the rows are absent)
+        """
+        members = self.nodes[rows].ravel()
+        member_rows = np.repeat(rows, 3)
+
+        # Stable sort by person keeps each person's rows in ascending order
+        order = np.argsort(members, kind="stable")
+        people, starts = np.unique(members[order], return_index=True)
+        return dict(zip(people.tolist(), np.split(member_rows[order], starts[1:])))
+
+
+class TriangleRows(Sequence):
+    """
+    Read-only list of triangle dicts backed by rows of a TriangleBatch.
+
+    Dicts are only built for the triangles actually accessed, so an action
+    strategy picking one triangle doesn't pay for the rest.
+    """
+
+    def __init__(self, batch, rows, person_id=None):
+        self.batch = batch
+        self.rows = rows
+        self.person_id = person_id
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return TriangleRows(self.batch, self.rows[index], self.person_id)
+        return self.batch.triangle(self.rows[index], self.person_id)
+
+
+class GraphMirror:
+    """
+    Dense adjacency view of the graph.
+
+    Edges are held as symmetric n x n matrices: an int8 matrix of type codes, a
+    matrix of decoded edge values (as fed to the balance rule) whose dtype comes
+    from the relationship type, e.g. int8 for discrete relationships, and an int32
+    matrix of the clock reading at which each edge was last set. The clock counts
+    decay steps (SocialBalanceModel.apply_decay advances it) and starts at zero
+    when the mirror is built, so ages loaded from Neo4j start at zero too.
+    """
+
+    def __init__(self, person_ids=(), dtype=float):
+        self.person_ids = list(person_ids)
+        self.index = {pid: i for i, pid in enumerate(self.person_ids)}
+        n = len(self.person_ids)
+        self.types = np.zeros((n, n), dtype=np.int8)
+        self.values = np.zeros((n, n), dtype=dtype)
+        self.set_at = np.zeros((n, n), dtype=np.int32)
+        self.clock = 0
+
+    @classmethod
+    def from_records(cls, nodes_and_edges, decode_array, dtype=float):
+        """
+        Build a mirror from Neo4jConnection.get_all_nodes_and_edges() records.
+
+        Args:
+            nodes_and_edges: records with p, r, p2 property maps
+            decode_array: function turning an array of stored values/types into
+                numeric edge values (RelationshipType.decode_from_storage_array)
+            dtype: dtype of the edge value matrix
+        """
+        person_ids = []
+        seen = set()
+        for record in nodes_and_edges:
+            for key in ("p", "p2"):
+                person = record[key]
+                if person and person["id"] not in seen:
+                    seen.add(person["id"])
+                    person_ids.append(person["id"])
+
+        person1_ids, person2_ids, rel_types, stored = [], [], [], []
+        for record in nodes_and_edges:
+            rel = record["r"]
+            if rel and record["p2"]:
+                value = rel.get("value")
+                person1_ids.append(record["p"]["id"])
+                person2_ids.append(record["p2"]["id"])
+                rel_types.append(rel["type"])
+                stored.append(rel["type"] if value is None else value)
+
+        mirror = cls(person_ids, dtype)
+        if stored:
+            # Numeric values decode as one array; type strings need an object array
+            # so that numbers mixed in with them aren't turned into strings
+            if any(isinstance(value, str) for value in stored):
+                stored = np.array(stored, dtype=object)
+            mirror.set_edges(person1_ids, person2_ids, rel_types, decode_array(np.asarray(stored)))
+        return mirror
+
+    def set_edge(self, person1_id, person2_id, rel_type, value, keep_age=False):
+        """
+        Create or overwrite the edge between two people.
+
+        Args:
+            keep_age: Leave the edge's age alone (for decay updates) instead of
+                restarting it at the current clock
+        """
+        if self.values.dtype.kind == "i" and value != int(value):
+            # A fractional value (e.g. a decayed discrete edge) no longer fits the integer matrix
+            self.values = self.values.astype(float)
+        i, j = self.index[person1_id], self.index[person2_id]
+        self.types[i, j] = self.types[j, i] = TYPE_CODES[rel_type]
+        self.values[i, j] = self.values[j, i] = value
+        if not keep_age:
+            self.set_at[i, j] = self.set_at[j, i] = self.clock
+
+    def set_edges(self, person1_ids, person2_ids, rel_types, values):
+        """Create or overwrite many edges at once (parallel sequences, as in set_edge)."""
+        values = np.asarray(values)
+        if self.values.dtype.kind == "i" and (values != np.round(values)).any():
+            self.values = self.values.astype(float)
+        i = np.array([self.index[pid] for pid in np.asarray(person1_ids).tolist()], dtype=int)
+        j = np.array([self.index[pid] for pid in np.asarray(person2_ids).tolist()], dtype=int)
+        codes = np.array([TYPE_CODES[rel_type] for rel_type in rel_types], dtype=np.int8)
+        self.types[i, j] = self.types[j, i] = codes
+        self.values[i, j] = self.values[j, i] = values
+        self.set_at[i, j] = self.set_at[j, i] = self.clock
+
+    def delete_edge(self, person1_id, person2_id):
+        """Remove the edge between two people, if any."""
+        i, j = self.index[person1_id], self.index[person2_id]
+        self.types[i, j] = self.types[j, i] = 0
+        self.values[i, j] = self.values[j, i] = 0.0
+
+    def apply_changes(self, changes, keep_age=False):
+        """
+        Apply the same change dicts passed to Neo4jConnection.apply_relationship_changes.
+
+        Args:
+            keep_age: Leave updated edges' ages alone (see set_edge)
+        """
+        for change in changes:
+            if change["op"] == "delete":
+                self.delete_edge(change["person1_id"], change["person2_id"])
+            elif change["op"] == "update":
+                # Updates only touch existing edges, like the Cypher MATCH ... SET
+                i, j = self.index[change["person1_id"]], self.index[change["person2_id"]]
+                if self.types[i, j]:
+                    self.set_edge(change["person1_id"], change["person2_id"], change["rel_type"], change["value"],
+                                  keep_age)
+            else:
+                self.set_edge(change["person1_id"], change["person2_id"], change["rel_type"], change["value"])
+
+    def get_edges(self):
+        """
+        List every edge once.
+
+        Returns:
+            Tuple (person1_ids, person2_ids, values, ages) of parallel arrays, where
+            ages are clock steps since each edge was last set
+        """
+        src, dst = np.nonzero(np.triu(self.types, 1))
+        ids = np.asarray(self.person_ids)
+        ages = self.clock - self.set_at[src, dst]
+        if not len(ids):
+            return np.empty(0, dtype=int), np.empty(0, dtype=int), self.values[src, dst], ages
+        return ids[src], ids[dst], self.values[src, dst], ages
+
+    def count_nodes(self):
+        """Number of people."""
+        return len(self.person_ids)
+
+    def count_relationships(self):
+        """Count relationships by type, like Neo4jConnection.count_relationships."""
+        upper = np.triu(self.types, 1)
+        codes, counts = np.unique(upper[upper > 0], return_counts=True)
+        return {TYPE_NAMES[int(code)]: int(count) for code, count in zip(codes, counts)}
+
+    def get_triangle_batch(self):
+        """
+        Find all triangles with three non-NEUTRAL edges.
+
+        Returns:
+            TriangleBatch with nodes n1 < n2 < n3 (by index) and edges n1-n2, n2-n3, n3-n1
+        """
+        n = len(self.person_ids)
+        connected = (self.types == TYPE_CODES["POSITIVE"]) | (self.types == TYPE_CODES["NEGATIVE"])
+        src, dst = np.nonzero(np.triu(connected, 1))
+
+        # For every edge (i, j) with i < j, the third vertices k > j adjacent to both.
+        # Edges are taken in chunks so the edge x person mask stays bounded on dense graphs
+        chunk = max(1, TRIANGLE_CHUNK_CELLS // max(n, 1))
+        later = np.arange(n)
+        n1, n2, n3 = [src[:0]], [dst[:0]], [src[:0]]
+        for start in range(0, len(src), chunk):
+            s, d = src[start:start + chunk], dst[start:start + chunk]
+            edge_idx, third = np.nonzero(connected[s] & connected[d] & (later > d[:, None]))
+            n1.append(s[edge_idx])
+            n2.append(d[edge_idx])
+            n3.append(third)
+        n1, n2, n3 = np.concatenate(n1), np.concatenate(n2), np.concatenate(n3)
+
+        ids = np.asarray(self.person_ids)
+        nodes = np.stack([ids[n1], ids[n2], ids[n3]], axis=1) if n else np.empty((0, 3), dtype=int)
+        edges = np.stack([self.values[n1, n2], self.values[n2, n3], self.values[n3, n1]], axis=1)
+        return TriangleBatch(nodes, edges)
+
+    def get_triangles(self):
+        """
+        Find all triangles with three non-NEUTRAL edges.
+
+        Returns:
+            List of dicts shaped like Neo4jConnection.get_triangles (n1 < n2 < n3 by index)
+        """
+        batch = self.get_triangle_batch()
+        return [batch.triangle(row) for row in range(len(batch))]
@@ -4,9 +4,11 @@ Social balance model variations with pluggable strategies.
 
 from .balance_rules import BalanceRule, ClassicBalanceRule, StrictPositiveBalanceRule, TriangleInequalityRule, ProductBalanceRule
 from .action_strategies import ActionStrategy, ClassicActionStrategy, ConservativeActionStrategy, AggressiveActionStrategy, ProactiveActionStrategy, BalancedActionStrategy, ProbabilisticActionStrategy
-from .relationship_types import RelationshipType, DiscreteRelationship, ContinuousRelationship, BipolarRelationship
-from .mechanisms import DecayMechanism, NoDecay, LinearDecay, ExponentialDecay, AsymmetricDecay, RandomEventGenerator, NoEvents
-from .factory import ModelFactory
+from .action_strategies import ActionKind, ChangeEdgeAction, CreateEdgeAction, DeleteEdgeAction
+from .relationship_types import RelationshipType, DiscreteRelationship, ContinuousRelationship, QuantizedContinuous, BipolarRelationship
+from .relationship_types import RelationshipTag
+from .mechanisms import DecayMechanism, NoDecay, LinearDecay, ExponentialDecay, AsymmetricDecay, HybridDecay, RandomEventGenerator, NoEvents
+from .factory import ModelFactory, FrozenConfig
 from .config import CURRENT_MODEL_CONFIG, PRESET_CONFIGS, use_preset
 
 __all__ = [
@@ -22,18 +24,26 @@ __all__ = [
     'ProactiveActionStrategy',
     'BalancedActionStrategy',
     'ProbabilisticActionStrategy',
+    'ActionKind',
+    'ChangeEdgeAction',
+    'CreateEdgeAction',
+    'DeleteEdgeAction',
     'RelationshipType',
     'DiscreteRelationship',
     'ContinuousRelationship',
+    'QuantizedContinuous',
     'BipolarRelationship',
+    'RelationshipTag',
     'DecayMechanism',
     'NoDecay',
     'LinearDecay',
     'ExponentialDecay',
     'AsymmetricDecay',
+    'HybridDecay',
     'RandomEventGenerator',
     'NoEvents',
     'ModelFactory',
+    'FrozenConfig',
     'CURRENT_MODEL_CONFIG',
     'PRESET_CONFIGS',
     'use_preset'
@@ -3,8 +3,65 @@ Different action strategies for how people respond to unbalanced triangles.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import List, Dict, Optional, Callable, ClassVar, Union
 import random
+import numpy as np
+
+class ActionKind(IntEnum):
+    """Kind of an action; tagged onto ActionType functions and action records."""
+    CREATE = 0
+    CHANGE = 1
+    DELETE = 2
+
+
+# (endpoint, endpoint, value) keys of the three edges in a triangle dict
+_EDGE_KEYS = (("n1", "n2", "e1"), ("n2", "n3", "e2"), ("n3", "n1", "e3"))
+
+
+# Action results. Plain slotted records: one is created per acting person per
+# iteration, so they are kept smaller and cheaper to build than dicts.
+@dataclass
+class ChangeEdgeAction:
+    """Set the edge between person1 and person2 to new_value."""
+    __slots__ = ("person1", "person2", "old_value", "new_value")
+    type: ClassVar[ActionKind] = ActionKind.CHANGE
+    person1: int
+    person2: int
+    old_value: float
+    new_value: float
+
+
+@dataclass
+class CreateEdgeAction:
+    """Create an edge with new_value between person1 and person2."""
+    __slots__ = ("person1", "person2", "new_value")
+    type: ClassVar[ActionKind] = ActionKind.CREATE
+    person1: int
+    person2: int
+    new_value: float
+
+
+@dataclass
+class DeleteEdgeAction:
+    """Remove the edge between person1 and person2."""
+    __slots__ = ("person1", "person2", "old_value")
+    type: ClassVar[ActionKind] = ActionKind.DELETE
+    person1: int
+    person2: int
+    old_value: float
+
+
+Action = Union[ChangeEdgeAction, CreateEdgeAction, DeleteEdgeAction]
+
+
+def action_kind(kind: ActionKind) -> Callable:
+    """Decorator tagging an action function with its kind (create/change/delete)."""
+    def decorator(action_fn: Callable) -> Callable:
+        action_fn._action_kind = kind
+        return action_fn
+    return decorator
 
 
 # Action type definitions with their execution logic
@@ -12,69 +69,43 @@ class ActionType:
     """Defines available action types and their logic."""
 
     @staticmethod
-    def change_edge_random(person_id: int, triangle: Dict, relationship_type: 'RelationshipType') -> Dict[str, Any]:
+    @action_kind(ActionKind.CHANGE)
+    def change_edge_random(person_id: int, triangle: Dict, relationship_type: 'RelationshipType') -> ChangeEdgeAction:
         """Change one random edge in triangle to a random new value."""
-        edges = [
-            (triangle["n1"], triangle["n2"], triangle["e1"]),
-            (triangle["n2"], triangle["n3"], triangle["e2"]),
-            (triangle["n3"], triangle["n1"], triangle["e3"])
-        ]
-        person1, person2, current_value = random.choice(edges)
+        key1, key2, value_key = _EDGE_KEYS[random.randrange(3)]
+        person1, person2, current_value = triangle[key1], triangle[key2], triangle[value_key]
         new_value = relationship_type.get_random_value(exclude=current_value)
 
-        return {
-            "type": "change_edge",
-            "person1": person1,
-            "person2": person2,
-            "old_value": current_value,
-            "new_value": new_value
-        }
+        return ChangeEdgeAction(person1, person2, current_value, new_value)
 
     @staticmethod
+    @action_kind(ActionKind.CHANGE)
     def change_edge_adjust(person_id: int, triangle: Dict, relationship_type: 'RelationshipType',
-                          adjustment: float = 0.2) -> Dict[str, Any]:
+                          adjustment: float = 0.2) -> ChangeEdgeAction:
         """Make small adjustment to one random edge in triangle."""
-        edges = [
-            (triangle["n1"], triangle["n2"], triangle["e1"]),
-            (triangle["n2"], triangle["n3"], triangle["e2"]),
-            (triangle["n3"], triangle["n1"], triangle["e3"])
-        ]
-        person1, person2, current_value = random.choice(edges)
+        key1, key2, value_key = _EDGE_KEYS[random.randrange(3)]
+        person1, person2, current_value = triangle[key1], triangle[key2], triangle[value_key]
         new_value = relationship_type.adjust_value(current_value, adjustment)
 
-        return {
-            "type": "change_edge",
-            "person1": person1,
-            "person2": person2,
-            "old_value": current_value,
-            "new_value": new_value
-        }
+        return ChangeEdgeAction(person1, person2, current_value, new_value)
 
     @staticmethod
+    @action_kind(ActionKind.CHANGE)
     def change_edge_strengthen_positive(person_id: int, triangle: Dict, relationship_type: 'RelationshipType',
-                                       amount: float = 0.3) -> Dict[str, Any]:
+                                       amount: float = 0.3) -> ChangeEdgeAction:
         """Strengthen positive edges or weaken negative edges in triangle."""
-        edges = [
-            (triangle["n1"], triangle["n2"], triangle["e1"]),
-            (triangle["n2"], triangle["n3"], triangle["e2"]),
-            (triangle["n3"], triangle["n1"], triangle["e3"])
-        ]
-        person1, person2, current_value = random.choice(edges)
+        key1, key2, value_key = _EDGE_KEYS[random.randrange(3)]
+        person1, person2, current_value = triangle[key1], triangle[key2], triangle[value_key]
 
         # Strengthen if positive, move toward zero/positive if negative
         new_value = relationship_type.adjust_value(current_value, amount)
 
-        return {
-            "type": "change_edge",
-            "person1": person1,
-            "person2": person2,
-            "old_value": current_value,
-            "new_value": new_value
-        }
+        return ChangeEdgeAction(person1, person2, current_value, new_value)
 
     @staticmethod
+    @action_kind(ActionKind.CREATE)
     def create_edge_random(person_id: int, neighbors_of_neighbors: List[Dict],
-                          relationship_type: 'RelationshipType') -> Optional[Dict[str, Any]]:
+                          relationship_type: 'RelationshipType') -> Optional[CreateEdgeAction]:
         """Create new edge to a random neighbor's neighbor."""
         if not neighbors_of_neighbors:
             return None
@@ -82,40 +113,36 @@ class ActionType:
         target = random.choice(neighbors_of_neighbors)
         new_value = relationship_type.get_random_value()
 
-        return {
-            "type": "create_edge",
-            "person1": person_id,
-            "person2": target["id"],
-            "new_value": new_value
-        }
+        return CreateEdgeAction(person_id, target["id"], new_value)
 
     @staticmethod
+    @action_kind(ActionKind.DELETE)
     def delete_edge_weak(person_id: int, triangle: Dict, relationship_type: 'RelationshipType',
-                        threshold: float = 0.2) -> Optional[Dict[str, Any]]:
+                        threshold: float = 0.2) -> Optional[DeleteEdgeAction]:
         """Delete the weakest edge in triangle if below threshold."""
-        edges = [
-            (triangle["n1"], triangle["n2"], triangle["e1"]),
-            (triangle["n2"], triangle["n3"], triangle["e2"]),
-            (triangle["n3"], triangle["n1"], triangle["e3"])
-        ]
+        # Find weakest edge (first one on ties)
+        a, b, c = abs(triangle["e1"]), abs(triangle["e2"]), abs(triangle["e3"])
+        if a <= b and a <= c:
+            weakest, strength = 0, a
+        elif b <= c:
+            weakest, strength = 1, b
+        else:
+            weakest, strength = 2, c
 
-        # Find weakest edge
-        weakest = min(edges, key=lambda e: abs(e[2]))
-        person1, person2, current_value = weakest
-
-        if abs(current_value) < threshold:
-            return {
-                "type": "delete_edge",
-                "person1": person1,
-                "person2": person2,
-                "old_value": current_value
-            }
+        if strength < threshold:
+            key1, key2, value_key = _EDGE_KEYS[weakest]
+            person1, person2, current_value = triangle[key1], triangle[key2], triangle[value_key]
+            return DeleteEdgeAction(person1, person2, current_value)
         return None
 
 
 class ActionStrategy(ABC):
     """Abstract base class for action strategies."""
 
+    # Whether select_action reads neighbors_of_neighbors; strategies that never
+    # create edges set this to False so the model can skip fetching them
+    requires_neighbors_of_neighbors = True
+
     @abstractmethod
     def select_action(
         self,
@@ -123,7 +150,7 @@ class ActionStrategy(ABC):
         unbalanced_triangles: List[Dict],
         neighbors_of_neighbors: List[Dict],
         relationship_type: 'RelationshipType'
-    ) -> Optional[Dict[str, Any]]:
+    ) -> Optional[Action]:
         """
         Select an action for a person to take.
 
@@ -134,10 +161,38 @@ class ActionStrategy(ABC):
             relationship_type: The relationship type system in use
 
         Returns:
-            Dictionary describing the action to take, or None if no action
+            Action describing what to do (ChangeEdgeAction, CreateEdgeAction or
+            DeleteEdgeAction), or None if no action
         """
         pass
 
+    def select_actions_batch(
+        self,
+        person_ids: List[int],
+        unbalanced_per_person: List[List[Dict]],
+        neighbors_per_person: List[List[Dict]],
+        relationship_type: 'RelationshipType'
+    ) -> List[Optional[Action]]:
+        """
+        Select actions for several people at once.
+
+        Strategies can override this to draw their random numbers in bulk;
+        by default it calls select_action for each person.
+
+        Args:
+            person_ids: IDs of the people taking action
+            unbalanced_per_person: Unbalanced triangles of each person
+            neighbors_per_person: Potential new connections of each person
+            relationship_type: The relationship type system in use
+
+        Returns:
+            One action (or None) per person, in order
+        """
+        return [
+            self.select_action(person_id, unbalanced, neighbors, relationship_type)
+            for person_id, unbalanced, neighbors in zip(person_ids, unbalanced_per_person, neighbors_per_person)
+        ]
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of this action strategy."""
@@ -158,46 +213,139 @@ class ProbabilisticActionStrategy(ActionStrategy):
         self.action_config = action_config
         self.name = name
 
-    def select_action(
-        self,
-        person_id: int,
-        unbalanced_triangles: List[Dict],
-        neighbors_of_neighbors: List[Dict],
-        relationship_type: 'RelationshipType'
-    ) -> Optional[Dict[str, Any]]:
+        # The config is fixed for the strategy's lifetime, so the sampling
+        # (alias) table and kind of each action are worked out once here.
+        # Zero-weight actions can never be drawn and are left out.
+        weighted = [(action_fn, weight, kwargs) for action_fn, weight, kwargs in action_config if weight > 0]
+        self._actions = [(action_fn, kwargs) for action_fn, _, kwargs in weighted]
+        self._total = sum(weight for _, weight, _ in weighted)
+        self._alias_prob, self._alias = self._build_alias_table([weight for _, weight, _ in weighted])
+        self._action_kind = [self._get_action_kind(action_fn) for action_fn, _ in self._actions]
+        self.requires_neighbors_of_neighbors = ActionKind.CREATE in self._action_kind
+
+        # Array copies of the alias table and a generator for select_actions_batch
+        self._alias_prob_array = np.asarray(self._alias_prob, dtype=float)
+        self._alias_array = np.asarray(self._alias, dtype=np.intp)
+        # Seeded from the random module; SocialBalanceModel replaces it with its own generator
+        self.rng = np.random.default_rng(random.getrandbits(64))
 
-        if not unbalanced_triangles:
-            return None
+    @staticmethod
+    def _build_alias_table(weights: List[float]) -> tuple:
+        """
+        Build Walker/Vose alias tables for drawing an index in O(1).
 
-        # Build weighted choices
-        actions = []
-        weights = []
+        Args:
+            weights: Positive weights, one per action
 
-        for action_fn, weight, kwargs in self.action_config:
-            actions.append((action_fn, kwargs))
-            weights.append(weight)
+        Returns:
+            Tuple (prob, alias): index i is kept with probability prob[i] and
+            replaced by alias[i] otherwise
+        """
+        n = len(weights)
+        if n == 0:
+            return [], []
 
-        # Normalize weights to probabilities
         total = sum(weights)
-        if total == 0:
-            return None
-        probabilities = [w / total for w in weights]
+        scaled = [weight * n / total for weight in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
 
-        # Select action based on probability distribution
-        action_fn, kwargs = random.choices(actions, weights=probabilities)[0]
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
 
-        # Execute the action
-        triangle = random.choice(unbalanced_triangles)
+        # Whatever is left over is 1.0 up to rounding
+        return prob, alias
 
-        # Different action types need different arguments
+    @staticmethod
+    def _get_action_kind(action_fn: Callable) -> Optional[ActionKind]:
+        """Return the action's kind tag, falling back to its name for untagged functions."""
+        kind = getattr(action_fn, '_action_kind', None)
+        if kind is not None:
+            return ActionKind(kind)
         if action_fn.__name__.startswith('create_edge'):
-            result = action_fn(person_id, neighbors_of_neighbors, relationship_type, **kwargs)
-        elif action_fn.__name__.startswith('change_edge') or action_fn.__name__.startswith('delete_edge'):
-            result = action_fn(person_id, triangle, relationship_type, **kwargs)
+            return ActionKind.CREATE
+        if action_fn.__name__.startswith('change_edge'):
+            return ActionKind.CHANGE
+        if action_fn.__name__.startswith('delete_edge'):
+            return ActionKind.DELETE
+        return None
+
+    def select_action(
+        self,
+        person_id: int,
+        unbalanced_triangles: List[Dict],
+        neighbors_of_neighbors: List[Dict],
+        relationship_type: 'RelationshipType'
+    ) -> Optional[Action]:
+
+        if not unbalanced_triangles or self._total <= 0:
+            return None
+
+        # Select action based on the weight distribution (no draw needed for a single action);
+        # one uniform gives both the alias column and the coin flip within it
+        if len(self._actions) == 1:
+            idx = 0
         else:
-            result = None
+            u = random.random() * len(self._actions)
+            idx = int(u)
+            if u - idx >= self._alias_prob[idx]:
+                idx = self._alias[idx]
+        return self._run_action(idx, person_id, unbalanced_triangles, None,
+                                neighbors_of_neighbors, relationship_type)
+
+    def select_actions_batch(
+        self,
+        person_ids: List[int],
+        unbalanced_per_person: List[List[Dict]],
+        neighbors_per_person: List[List[Dict]],
+        relationship_type: 'RelationshipType'
+    ) -> List[Optional[Action]]:
+        n = len(person_ids)
+        if self._total <= 0:
+            return [None] * n
+
+        # Draw every person's action (alias method) and triangle index in bulk
+        if len(self._actions) == 1:
+            action_idx = np.zeros(n, dtype=np.intp)
+        else:
+            u = self.rng.random(n) * len(self._actions)
+            column = u.astype(np.intp)
+            action_idx = np.where(u - column >= self._alias_prob_array[column], self._alias_array[column], column)
+
+        counts = np.fromiter((len(triangles) for triangles in unbalanced_per_person), dtype=np.intp, count=n)
+        triangle_idx = (self.rng.random(n) * counts).astype(np.intp)
+
+        return [
+            self._run_action(idx, person_id, unbalanced, triangle, neighbors, relationship_type)
+            if unbalanced else None
+            for person_id, unbalanced, neighbors, idx, triangle in zip(
+                person_ids, unbalanced_per_person, neighbors_per_person,
+                action_idx.tolist(), triangle_idx.tolist()
+            )
+        ]
 
-        return result
+    def _run_action(self, idx, person_id, unbalanced_triangles, triangle_index,
+                    neighbors_of_neighbors, relationship_type) -> Optional[Action]:
+        """Call action idx with the arguments its kind expects (random triangle if triangle_index is None)."""
+        action_fn, kwargs = self._actions[idx]
+        kind = self._action_kind[idx]
+
+        # Different action types need different arguments; only triangle
+        # actions need a triangle picked
+        if kind is ActionKind.CREATE:
+            return action_fn(person_id, neighbors_of_neighbors, relationship_type, **kwargs)
+        if kind is ActionKind.CHANGE or kind is ActionKind.DELETE:
+            if triangle_index is None:
+                triangle = random.choice(unbalanced_triangles)
+            else:
+                triangle = unbalanced_triangles[triangle_index]
+            return action_fn(person_id, triangle, relationship_type, **kwargs)
+        return None
 
     def get_name(self) -> str:
         return self.name
@@ -4,6 +4,18 @@ Different rules for determining triangle balance.
 
 from abc import ABC, abstractmethod
 from typing import List, Optional
+import numpy as np
+
+
+# Status codes returned by is_balanced_batch
+BALANCED = 1
+UNBALANCED = 0
+INCOMPLETE = -1
+
+# Balance of a complete triangle indexed by its sign pattern, packed as
+# (e1 > 0) << 2 | (e2 > 0) << 1 | (e3 > 0)
+_CLASSIC_LUT = tuple(bin(key).count("1") in (1, 3) for key in range(8))
+_TRANSITIVITY_LUT = tuple(bin(key).count("1") != 2 for key in range(8))
 
 
 class BalanceRule(ABC):
@@ -22,6 +34,22 @@ class BalanceRule(ABC):
         """
         pass
 
+    def is_balanced_batch(self, edges: np.ndarray) -> np.ndarray:
+        """
+        Check many triangles at once.
+
+        Rules override this with a vectorized version; the default falls back
+        to calling is_balanced per triangle.
+
+        Args:
+            edges: (N, 3) array of edge values, one triangle per row
+
+        Returns:
+            int8 array with BALANCED, UNBALANCED or INCOMPLETE per triangle
+        """
+        status = {True: BALANCED, False: UNBALANCED, None: INCOMPLETE}
+        return np.array([status[self.is_balanced(row)] for row in np.asarray(edges).tolist()], dtype=np.int8)
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of this balance rule."""
@@ -41,20 +69,21 @@ class ClassicBalanceRule(BalanceRule):
         if len(edge_values) != 3:
             return None
 
-        # Count positive and negative edges
-        positive_count = sum(1 for v in edge_values if v > 0)
-        negative_count = sum(1 for v in edge_values if v < 0)
-        neutral_count = sum(1 for v in edge_values if v == 0)
+        a, b, c = edge_values
 
         # Skip triangles with neutral edges - incomplete triangles
-        if neutral_count > 0:
+        if a == 0 or b == 0 or c == 0:
             return None
 
-        # Balanced: 3 positive OR 1 positive + 2 negative OR 3 negative
-        if positive_count == 3 or (positive_count == 1 and negative_count == 2):
-            return True
+        # Balanced: 3 positive OR 1 positive + 2 negative
+        return _CLASSIC_LUT[(a > 0) << 2 | (b > 0) << 1 | (c > 0)]
 
-        return False
+    def is_balanced_batch(self, edges: np.ndarray) -> np.ndarray:
+        # +++ and +-- are exactly the sign patterns with a positive product;
+        # a neutral edge zeroes it. Signs keep the product in int8 range, so
+        # int8 discrete edges never need widening.
+        sign_product = np.sign(edges).astype(np.int8).prod(axis=1, dtype=np.int8)
+        return np.where(sign_product == 0, INCOMPLETE, sign_product > 0).astype(np.int8)
 
     def get_name(self) -> str:
         return "Classic Heider Triangle Balance (+++, +--)"
@@ -73,20 +102,21 @@ class TransitivityBalanceRule(BalanceRule):
         if len(edge_values) != 3:
             return None
 
-        # Count positive and negative edges
-        positive_count = sum(1 for v in edge_values if v > 0)
-        negative_count = sum(1 for v in edge_values if v < 0)
-        neutral_count = sum(1 for v in edge_values if v == 0)
+        a, b, c = edge_values
 
         # Skip triangles with neutral edges - incomplete triangles
-        if neutral_count > 0:
+        if a == 0 or b == 0 or c == 0:
             return None
 
         # Balanced: 3 positive OR 1 positive + 2 negative OR 3 negative
-        if positive_count == 3 or (positive_count == 1 and negative_count == 2) or negative_count == 3:
-            return True
+        return _TRANSITIVITY_LUT[(a > 0) << 2 | (b > 0) << 1 | (c > 0)]
 
-        return False
+    def is_balanced_batch(self, edges: np.ndarray) -> np.ndarray:
+        # As in ClassicBalanceRule, plus --- (the only negative product allowed)
+        edges = np.asarray(edges)
+        sign_product = np.sign(edges).astype(np.int8).prod(axis=1, dtype=np.int8)
+        balanced = (sign_product > 0) | (edges < 0).all(axis=1)
+        return np.where(sign_product == 0, INCOMPLETE, balanced).astype(np.int8)
 
     def get_name(self) -> str:
         return "Transitivity Balance  (+++, +--, ---)"
@@ -113,6 +143,12 @@ class StrictPositiveBalanceRule(BalanceRule):
 
         return False
 
+    def is_balanced_batch(self, edges: np.ndarray) -> np.ndarray:
+        edges = np.asarray(edges)
+        status = np.where((edges > 0).all(axis=1), BALANCED, UNBALANCED)
+        status[(edges == 0).any(axis=1)] = INCOMPLETE
+        return status.astype(np.int8)
+
     def get_name(self) -> str:
         return "Strict Positive Balance"
 
@@ -162,6 +198,18 @@ class TriangleInequalityRule(BalanceRule):
         # All three must hold for balance
         return ineq1 and ineq2 and ineq3
 
+    def is_balanced_batch(self, edges: np.ndarray) -> np.ndarray:
+        edges = np.asarray(edges)
+        complete = ((edges >= self.min_strength) & (edges > 0)).all(axis=1)
+
+        # Same three inequalities as is_balanced, column-wise
+        w1, w2, w3 = edges[:, 0], edges[:, 1], edges[:, 2]
+        balanced = (((w1 + w2) >= (w3 - self.tolerance))
+                    & ((w2 + w3) >= (w1 - self.tolerance))
+                    & ((w3 + w1) >= (w2 - self.tolerance)))
+
+        return np.where(complete, balanced, INCOMPLETE).astype(np.int8)
+
     def get_name(self) -> str:
         return f"Triangle Inequality (min={self.min_strength})"
 
@@ -196,12 +244,15 @@ class ProductBalanceRule(BalanceRule):
         if len(edge_values) != 3:
             return None
 
+        e1, e2, e3 = edge_values
+        min_strength = self.min_strength
+
         # If any edge is neutral/missing (absolute value too low), incomplete
-        if any(abs(v) < self.min_strength for v in edge_values):
+        if abs(e1) < min_strength or abs(e2) < min_strength or abs(e3) < min_strength:
             return None
 
         # Calculate product of edge values
-        product = edge_values[0] * edge_values[1] * edge_values[2]
+        product = e1 * e2 * e3
 
         # Positive product = balanced, negative product = unbalanced
         if product > self.threshold:
@@ -211,5 +262,15 @@ class ProductBalanceRule(BalanceRule):
         else:
             return None  # Ambiguous (product near zero)
 
+    def is_balanced_batch(self, edges: np.ndarray) -> np.ndarray:
+        edges = np.asarray(edges)
+        strong = (np.abs(edges) >= self.min_strength).all(axis=1)
+        product = edges.prod(axis=1)
+
+        status = np.full(len(edges), INCOMPLETE, dtype=np.int8)
+        status[strong & (product > self.threshold)] = BALANCED
+        status[strong & (product < -self.threshold)] = UNBALANCED
+        return status
+
     def get_name(self) -> str:
         return f"Product Balance (threshold={self.threshold})"
@@ -39,12 +39,12 @@ CURRENT_MODEL_CONFIG = {
     },
 
     # Relationship type: How edge values are represented
-    # Options: DiscreteRelationship, ContinuousRelationship, BipolarRelationship
+    # Options: DiscreteRelationship, ContinuousRelationship, QuantizedContinuous, BipolarRelationship
     "relationship_type": "DiscreteRelationship",
 
     # Relationship type parameters
     "relationship_params": {
-        # For ContinuousRelationship:
+        # For ContinuousRelationship / QuantizedContinuous:
         # "min_val": 0.0,
         # "max_val": 1.0,
         # "neutral_threshold": 0.01,
@@ -55,7 +55,7 @@ CURRENT_MODEL_CONFIG = {
     },
 
     # Decay mechanism: How relationships decay over time
-    # Options: NoDecay, LinearDecay, ExponentialDecay, AsymmetricDecay
+    # Options: NoDecay, LinearDecay, ExponentialDecay, AsymmetricDecay, HybridDecay
     "decay": "NoDecay",
 
     # Decay parameters (optional, depends on decay type)
@@ -69,6 +69,10 @@ CURRENT_MODEL_CONFIG = {
         # For AsymmetricDecay:
         # "positive_rate": 0.02,
         # "negative_rate": 0.005,
+
+        # For HybridDecay:
+        # "time_constant": 50.0,
+        # "t_switch": 100.0,
     },
 }
 
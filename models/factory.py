@@ -3,8 +3,10 @@ Factory for creating model instances from configuration.
 Auto-generates class registry from imported modules.
 """
 
-from typing import Dict, Any
-import inspect
+from typing import Dict, Any, Union
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
 from . import balance_rules
 from . import action_strategies
 from . import relationship_types
@@ -12,6 +14,16 @@ from . import mechanisms
 from .config import CURRENT_MODEL_CONFIG
 
 
+# A configuration with class names already resolved to classes and parameters
+# copied into read-only mappings; see ModelFactory.freeze_config
+FrozenConfig = namedtuple("FrozenConfig", [
+    "balance_rule_cls", "balance_params",
+    "action_strategy_cls", "action_params",
+    "relationship_type_cls", "relationship_params",
+    "decay_cls", "decay_params",
+])
+
+
 class ModelFactory:
     """Factory for creating model components from configuration using class names."""
 
@@ -20,9 +32,10 @@ class ModelFactory:
     def _build_registry(module, base_class):
         """Build a registry of classes from a module that inherit from base_class."""
         registry = {}
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        for name, obj in sorted(vars(module).items()):
             # Only include classes defined in this module (not imports) that inherit from base_class
-            if obj.__module__ == module.__name__ and issubclass(obj, base_class) and obj != base_class:
+            if (isinstance(obj, type) and obj.__module__ == module.__name__
+                    and issubclass(obj, base_class) and obj != base_class):
                 registry[name] = obj
         return registry
 
@@ -32,16 +45,52 @@ class ModelFactory:
     RELATIONSHIP_TYPES = _build_registry.__func__(relationship_types, relationship_types.RelationshipType)
     DECAY_MECHANISMS = _build_registry.__func__(mechanisms, mechanisms.DecayMechanism)
 
+    @staticmethod
+    def _resolve(registry: Dict[str, type], class_name: str, label: str) -> type:
+        """Look up a class by name in a registry, raising ValueError if it is unknown."""
+        if class_name not in registry:
+            raise ValueError(f"Unknown {label}: {class_name}. Available: {list(registry.keys())}")
+        return registry[class_name]
+
+    @staticmethod
+    def freeze_config(config: Dict[str, Any] = None) -> FrozenConfig:
+        """
+        Resolve a configuration dict once, so components can be built repeatedly
+        without string lookups.
+
+        Args:
+            config: Configuration dictionary (uses CURRENT_MODEL_CONFIG if None)
+
+        Returns:
+            FrozenConfig with classes and read-only parameter mappings
+        """
+        if isinstance(config, FrozenConfig):
+            return config
+        if config is None:
+            config = CURRENT_MODEL_CONFIG
+
+        resolve = ModelFactory._resolve
+        return FrozenConfig(
+            balance_rule_cls=resolve(ModelFactory.BALANCE_RULES,
+                                     config.get("balance_rule", "ClassicBalanceRule"), "balance rule"),
+            balance_params=MappingProxyType(dict(config.get("balance_params", {}))),
+            action_strategy_cls=resolve(ModelFactory.ACTION_STRATEGIES,
+                                        config.get("action_strategy", "ClassicActionStrategy"), "action strategy"),
+            action_params=MappingProxyType(dict(config.get("action_params", {}))),
+            relationship_type_cls=resolve(ModelFactory.RELATIONSHIP_TYPES,
+                                          config.get("relationship_type", "DiscreteRelationship"), "relationship type"),
+            relationship_params=MappingProxyType(dict(config.get("relationship_params", {}))),
+            decay_cls=resolve(ModelFactory.DECAY_MECHANISMS, config.get("decay", "NoDecay"), "decay type"),
+            decay_params=MappingProxyType(dict(config.get("decay_params", {}))),
+        )
+
     @staticmethod
     def create_balance_rule(config: Dict[str, Any]) -> balance_rules.BalanceRule:
         """Create a balance rule from configuration using class name."""
         class_name = config.get("balance_rule", "ClassicBalanceRule")
         params = config.get("balance_params", {})
 
-        if class_name not in ModelFactory.BALANCE_RULES:
-            raise ValueError(f"Unknown balance rule: {class_name}. Available: {list(ModelFactory.BALANCE_RULES.keys())}")
-
-        return ModelFactory.BALANCE_RULES[class_name](**params)
+        return ModelFactory._resolve(ModelFactory.BALANCE_RULES, class_name, "balance rule")(**params)
 
     @staticmethod
     def create_action_strategy(config: Dict[str, Any]) -> action_strategies.ActionStrategy:
@@ -49,10 +98,7 @@ class ModelFactory:
         class_name = config.get("action_strategy", "ClassicActionStrategy")
         params = config.get("action_params", {})
 
-        if class_name not in ModelFactory.ACTION_STRATEGIES:
-            raise ValueError(f"Unknown action strategy: {class_name}. Available: {list(ModelFactory.ACTION_STRATEGIES.keys())}")
-
-        return ModelFactory.ACTION_STRATEGIES[class_name](**params)
+        return ModelFactory._resolve(ModelFactory.ACTION_STRATEGIES, class_name, "action strategy")(**params)
 
     @staticmethod
     def create_relationship_type(config: Dict[str, Any]) -> relationship_types.RelationshipType:
@@ -60,10 +106,7 @@ class ModelFactory:
         class_name = config.get("relationship_type", "DiscreteRelationship")
         params = config.get("relationship_params", {})
 
-        if class_name not in ModelFactory.RELATIONSHIP_TYPES:
-            raise ValueError(f"Unknown relationship type: {class_name}. Available: {list(ModelFactory.RELATIONSHIP_TYPES.keys())}")
-
-        return ModelFactory.RELATIONSHIP_TYPES[class_name](**params)
+        return ModelFactory._resolve(ModelFactory.RELATIONSHIP_TYPES, class_name, "relationship type")(**params)
 
     @staticmethod
     def create_decay_mechanism(config: Dict[str, Any]) -> mechanisms.DecayMechanism:
@@ -71,48 +114,73 @@ class ModelFactory:
         class_name = config.get("decay", "NoDecay")
         params = config.get("decay_params", {})
 
-        if class_name not in ModelFactory.DECAY_MECHANISMS:
-            raise ValueError(f"Unknown decay type: {class_name}. Available: {list(ModelFactory.DECAY_MECHANISMS.keys())}")
-
-        return ModelFactory.DECAY_MECHANISMS[class_name](**params)
+        return ModelFactory._resolve(ModelFactory.DECAY_MECHANISMS, class_name, "decay type")(**params)
 
     @staticmethod
-    def create_from_config(config: Dict[str, Any] = None) -> Dict[str, Any]:
+    def create_from_config(config: Union[Dict[str, Any], FrozenConfig] = None) -> Dict[str, Any]:
         """
-        Create all model components from a configuration dict.
+        Create all model components from a configuration.
 
         Args:
-            config: Configuration dictionary (uses CURRENT_MODEL_CONFIG if None)
+            config: Configuration dictionary or FrozenConfig (uses CURRENT_MODEL_CONFIG if None)
 
         Returns:
             Dictionary with all model components
         """
-        if config is None:
-            config = CURRENT_MODEL_CONFIG
+        config = ModelFactory.freeze_config(config)
 
         return {
-            "balance_rule": ModelFactory.create_balance_rule(config),
-            "action_strategy": ModelFactory.create_action_strategy(config),
-            "relationship_type": ModelFactory.create_relationship_type(config),
-            "decay": ModelFactory.create_decay_mechanism(config),
+            "balance_rule": config.balance_rule_cls(**config.balance_params),
+            "action_strategy": config.action_strategy_cls(**config.action_params),
+            "relationship_type": config.relationship_type_cls(**config.relationship_params),
+            "decay": config.decay_cls(**config.decay_params),
         }
 
     @staticmethod
-    def get_model_description(config: Dict[str, Any] = None) -> str:
+    def get_model_description(config: Union[Dict[str, Any], FrozenConfig] = None,
+                              components: Dict[str, Any] = None) -> str:
         """
-        Get a human-readable description of the model configuration.
+        Get a human-readable description of the model configuration (cached per configuration).
 
         Args:
-            config: Configuration dictionary (uses CURRENT_MODEL_CONFIG if None)
+            config: Configuration dictionary or FrozenConfig (uses CURRENT_MODEL_CONFIG if None)
+            components: Components already returned by create_from_config; when given
+                they are described directly instead of building new ones from config
 
         Returns:
             Description string
         """
-        if config is None:
-            config = CURRENT_MODEL_CONFIG
+        if components is not None:
+            return ModelFactory._describe_components(components)
 
-        components = ModelFactory.create_from_config(config)
+        frozen = ModelFactory.freeze_config(config)
+        try:
+            return ModelFactory._describe_frozen(ModelFactory._frozen_key(frozen))
+        except TypeError:
+            # Unhashable parameter values; describe without caching
+            return ModelFactory._describe_components(ModelFactory.create_from_config(frozen))
+
+    @staticmethod
+    def _frozen_key(frozen: FrozenConfig) -> tuple:
+        """Hashable form of a FrozenConfig (parameter mappings as sorted item tuples)."""
+        return tuple(
+            tuple(sorted(field.items())) if isinstance(field, MappingProxyType) else field
+            for field in frozen
+        )
 
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _describe_frozen(key: tuple) -> str:
+        """Cached description of the configuration a _frozen_key was built from."""
+        frozen = FrozenConfig(*(
+            MappingProxyType(dict(field)) if isinstance(field, tuple) else field
+            for field in key
+        ))
+        return ModelFactory._describe_components(ModelFactory.create_from_config(frozen))
+
+    @staticmethod
+    def _describe_components(components: Dict[str, Any]) -> str:
+        """Build the description string for a dict of model components."""
         description = "Model Configuration:\n"
         description += f"  Balance Rule: {components['balance_rule'].get_name()}\n"
         description += f"  Action Strategy: {components['action_strategy'].get_name()}\n"
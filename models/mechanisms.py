@@ -3,6 +3,14 @@ Additional mechanisms: relationship decay.
 """
 
 from abc import ABC, abstractmethod
+import math
+import numpy as np
+
+
+def _as_float_array(values) -> np.ndarray:
+    """View values as a floating-point array, keeping float32 input as float32."""
+    values = np.asarray(values)
+    return values if values.dtype.kind == "f" else values.astype(float)
 
 
 class DecayMechanism(ABC):
@@ -22,6 +30,35 @@ class DecayMechanism(ABC):
         """
         pass
 
+    def apply_decay_array(self, edge_values: np.ndarray, relationship_type: 'RelationshipType',
+                          steps=1, ages=None) -> np.ndarray:
+        """
+        Apply decay to many edge values at once.
+
+        Subclasses override this with a vectorized (closed-form in steps) version;
+        the default calls apply_decay per value and step.
+
+        Args:
+            edge_values: Array of current edge values
+            relationship_type: The relationship type system
+            steps: Number of decay steps to apply, either one count for all values
+                or an array with one count per value (e.g. iterations since each
+                edge was last brought up to date)
+            ages: Optional array of steps since each edge was set, for mechanisms
+                whose rate depends on a relationship's age (None means all new)
+
+        Returns:
+            New array of decayed values
+        """
+        edge_values = np.asarray(edge_values)
+        steps = np.broadcast_to(steps, edge_values.shape)
+        new_values = []
+        for value, count in zip(edge_values.tolist(), steps.tolist()):
+            for _ in range(count):
+                value = self.apply_decay(value, relationship_type)
+            new_values.append(value)
+        return np.array(new_values, dtype=float)
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of this decay mechanism."""
@@ -34,6 +71,10 @@ class NoDecay(DecayMechanism):
     def apply_decay(self, edge_value: float, relationship_type: 'RelationshipType') -> float:
         return edge_value
 
+    def apply_decay_array(self, edge_values: np.ndarray, relationship_type: 'RelationshipType',
+                          steps=1, ages=None) -> np.ndarray:
+        return np.array(edge_values, dtype=float)
+
     def get_name(self) -> str:
         return "No Decay"
 
@@ -48,14 +89,18 @@ class LinearDecay(DecayMechanism):
         self.rate = rate
 
     def apply_decay(self, edge_value: float, relationship_type: 'RelationshipType') -> float:
-        # Move toward zero
-        if edge_value > 0:
-            new_value = edge_value - self.rate
-            return max(0, new_value)
-        elif edge_value < 0:
-            new_value = edge_value + self.rate
-            return min(0, new_value)
-        return edge_value
+        # Move toward zero: shrink the magnitude, stopping at zero, and keep the sign
+        return math.copysign(max(abs(edge_value) - self.rate, 0.0), edge_value)
+
+    def apply_decay_array(self, edge_values: np.ndarray, relationship_type: 'RelationshipType',
+                          steps=1, ages=None) -> np.ndarray:
+        # Shrink the magnitude by rate per step, stopping at zero, and keep the
+        # sign; everything after abs() works in place on one buffer
+        edge_values = _as_float_array(edge_values)
+        magnitude = np.abs(edge_values)
+        magnitude -= self.rate if np.ndim(steps) == 0 and steps == 1 else self.rate * np.asarray(steps)
+        np.maximum(magnitude, 0.0, out=magnitude)
+        return np.copysign(magnitude, edge_values, out=magnitude)
 
     def get_name(self) -> str:
         return f"Linear Decay (rate={self.rate})"
@@ -67,6 +112,9 @@ class ExponentialDecay(DecayMechanism):
     Stronger relationships decay more slowly (in absolute terms).
     """
 
+    # Power tables by half-life, shared (read-only) by every instance with that half-life
+    _TABLE_CACHE = {}
+
     def __init__(self, half_life: float = 50.0):
         """
         Args:
@@ -75,6 +123,15 @@ class ExponentialDecay(DecayMechanism):
         self.half_life = half_life
         self.decay_factor = 0.5 ** (1.0 / half_life)
 
+        # decay_factor ** k for the step counts that come up in practice (at
+        # least 256, and four half-lives for slow decays)
+        table = self._TABLE_CACHE.get(half_life)
+        if table is None:
+            table = self.decay_factor ** np.arange(max(256, 4 * int(np.ceil(half_life)) + 1))
+            table.flags.writeable = False
+            self._TABLE_CACHE[half_life] = table
+        self._power_table = table
+
     def apply_decay(self, edge_value: float, relationship_type: 'RelationshipType') -> float:
         # Multiply by decay factor (preserves sign)
         new_value = edge_value * self.decay_factor
@@ -85,6 +142,29 @@ class ExponentialDecay(DecayMechanism):
 
         return new_value
 
+    def apply_decay_array(self, edge_values: np.ndarray, relationship_type: 'RelationshipType',
+                          steps=1, ages=None) -> np.ndarray:
+        # v * factor^steps; magnitudes only shrink, so snapping once at the end
+        # matches snapping after every step
+        new_values = np.multiply(edge_values, self._factor_powers(steps), dtype=float)
+        new_values[np.abs(new_values) < 0.001] = 0.0
+        return new_values
+
+    def _factor_powers(self, steps):
+        """decay_factor ** steps, read from the precomputed table where possible."""
+        steps = np.asarray(steps)
+        size = len(self._power_table)
+        if not steps.size or steps.max() < size:
+            return self._power_table[steps]
+        if not steps.ndim:
+            return self.decay_factor ** steps
+
+        # Only the step counts past the end of the table fall back to pow
+        powers = self._power_table[np.minimum(steps, size - 1)]
+        beyond = steps >= size
+        powers[beyond] = self.decay_factor ** steps[beyond]
+        return powers
+
     def get_name(self) -> str:
         return f"Exponential Decay (half_life={self.half_life})"
 
@@ -100,20 +180,91 @@ class AsymmetricDecay(DecayMechanism):
         self.negative_rate = negative_rate
 
     def apply_decay(self, edge_value: float, relationship_type: 'RelationshipType') -> float:
-        if edge_value > 0:
-            # Positive decays faster
-            new_value = edge_value - self.positive_rate
-            return max(0, new_value)
-        elif edge_value < 0:
-            # Negative decays slower (grudges persist)
-            new_value = edge_value + self.negative_rate
-            return min(0, new_value)
-        return edge_value
+        # Positive decays faster; negative decays slower (grudges persist)
+        rate = self.positive_rate if edge_value > 0 else self.negative_rate
+        return math.copysign(max(abs(edge_value) - rate, 0.0), edge_value)
+
+    def apply_decay_array(self, edge_values: np.ndarray, relationship_type: 'RelationshipType',
+                          steps=1, ages=None) -> np.ndarray:
+        # Same in-place shrink as LinearDecay, with the rate picked by sign (zeros
+        # stay zero whichever rate they get)
+        edge_values = _as_float_array(edge_values)
+        magnitude = np.abs(edge_values)
+        rates = np.where(edge_values > 0, self.positive_rate, self.negative_rate).astype(edge_values.dtype)
+        magnitude -= rates if np.ndim(steps) == 0 and steps == 1 else rates * np.asarray(steps)
+        np.maximum(magnitude, 0.0, out=magnitude)
+        return np.copysign(magnitude, edge_values, out=magnitude)
 
     def get_name(self) -> str:
         return f"Asymmetric Decay (pos={self.positive_rate}, neg={self.negative_rate})"
 
 
+class HybridDecay(DecayMechanism):
+    """
+    Exponential decay for young relationships with a power-law tail for old ones.
+
+    Retention at age t is exp(-t / time_constant) up to t_switch and
+    scale * t ** -exponent after it. The power law is fitted so that both the
+    value and the slope are continuous at t_switch, so only time_constant and
+    t_switch need tuning. Old relationships fade more slowly than under pure
+    exponential decay. Which phase applies depends on each edge's age, so
+    apply_decay_array needs the ages to go past the exponential phase.
+    """
+
+    def __init__(self, time_constant: float = 50.0, t_switch: float = 100.0):
+        """
+        Args:
+            time_constant: Iterations for a young relationship to fall to 1/e of its strength
+            t_switch: Age (in iterations) at which decay switches to the power law
+        """
+        self.time_constant = time_constant
+        self.t_switch = t_switch
+
+        # Matching exp(-t/S) and its derivative at t_switch gives b = t_switch / S
+        self.exponent = t_switch / time_constant
+        self.scale = np.exp(-self.exponent) * t_switch ** self.exponent
+        self._step_factor = math.exp(-1.0 / time_constant)
+
+    def retention(self, ages: np.ndarray) -> np.ndarray:
+        """
+        Fraction of its initial strength a relationship keeps at the given ages.
+
+        Args:
+            ages: Array of ages in iterations
+
+        Returns:
+            Array of retention factors in (0, 1]
+        """
+        ages = np.asarray(ages, dtype=float)
+        # Clamp the power-law argument so young ages don't divide by zero in the unused branch
+        tail = self.scale * np.maximum(ages, self.t_switch) ** -self.exponent
+        return np.where(ages < self.t_switch, np.exp(-ages / self.time_constant), tail)
+
+    def apply_decay(self, edge_value: float, relationship_type: 'RelationshipType') -> float:
+        # Without an edge's age only the (young) exponential phase can be stepped
+        new_value = edge_value * self._step_factor
+        if abs(new_value) < 0.001:
+            return 0.0
+        return new_value
+
+    def apply_decay_array(self, edge_values: np.ndarray, relationship_type: 'RelationshipType',
+                          steps=1, ages=None) -> np.ndarray:
+        # Going from age a to a + steps keeps retention(a + steps) / retention(a);
+        # edges still young afterwards stay on the plain exponential, the rest
+        # take the ratio across or within the power-law tail
+        ages = np.zeros(np.shape(edge_values)) if ages is None else np.asarray(ages, dtype=float)
+        new_ages = ages + steps
+        factor = np.where(new_ages < self.t_switch,
+                          np.exp(-np.asarray(steps) / self.time_constant),
+                          self.retention(new_ages) / self.retention(ages))
+        new_values = np.multiply(edge_values, factor, dtype=float)
+        new_values[np.abs(new_values) < 0.001] = 0.0
+        return new_values
+
+    def get_name(self) -> str:
+        return f"Hybrid Decay (time_constant={self.time_constant}, t_switch={self.t_switch})"
+
+
 # Placeholder for future random events
 class RandomEventGenerator(ABC):
     """Abstract base class for random events (not yet implemented)."""
@@ -3,13 +3,32 @@ Different relationship type systems (discrete vs continuous).
 """
 
 from abc import ABC, abstractmethod
+from enum import IntEnum
 import random
 from typing import Optional, Any
+import numpy as np
+
+
+class RelationshipTag(IntEnum):
+    """Sign of a relationship value, as stored in Neo4j's type string."""
+    NEUTRAL = 0
+    POSITIVE = 1
+    NEGATIVE = -1
+
+
+# Storage type string for each tag; indexed by the tag itself, so -1 picks "NEGATIVE"
+_TAG_STR = ("NEUTRAL", "POSITIVE", "NEGATIVE")
 
 
 class RelationshipType(ABC):
     """Abstract base class for relationship type systems."""
 
+    # NumPy dtype able to hold every decoded value (used for in-process edge arrays)
+    dtype = np.float64
+
+    # Compact dtype for arrays of encoded values (see encode_to_storage_array)
+    storage_dtype = np.float32
+
     @abstractmethod
     def get_random_value(self, exclude: Optional[float] = None) -> float:
         """
@@ -23,6 +42,43 @@ class RelationshipType(ABC):
         """
         pass
 
+    def get_random_values(self, n: int, exclude: Optional[float] = None) -> np.ndarray:
+        """
+        Get many random relationship values at once.
+
+        Subclasses override this to draw the whole array from NumPy; the default
+        calls get_random_value n times.
+
+        Args:
+            n: Number of values to draw
+            exclude: Optional value to exclude from random selection
+
+        Returns:
+            Array of n random relationship values
+        """
+        return np.array([self.get_random_value(exclude) for _ in range(n)], dtype=float)
+
+    def get_random_negative_values(self, n: int) -> np.ndarray:
+        """
+        Get many random negative relationship values at once.
+
+        Only meaningful for types whose range includes negative values. The
+        default redraws get_random_values until every value is negative;
+        subclasses override it to sample the negative range directly.
+
+        Args:
+            n: Number of values to draw
+
+        Returns:
+            Array of n random negative relationship values
+        """
+        values = self.get_random_values(n)
+        redraw = values >= 0
+        while redraw.any():
+            values[redraw] = self.get_random_values(int(redraw.sum()))
+            redraw = values >= 0
+        return values
+
     @abstractmethod
     def adjust_value(self, current_value: float, adjustment: float) -> float:
         """
@@ -37,6 +93,25 @@ class RelationshipType(ABC):
         """
         pass
 
+    def adjust_values(self, current_values: np.ndarray, adjustments: np.ndarray) -> np.ndarray:
+        """
+        Adjust many relationship values at once.
+
+        Subclasses override this with a vectorized version; the default calls
+        adjust_value per value.
+
+        Args:
+            current_values: Array of current relationship values
+            adjustments: Adjustment per value (or one adjustment for all)
+
+        Returns:
+            New array of adjusted values
+        """
+        current_values = np.asarray(current_values)
+        adjustments = np.broadcast_to(adjustments, current_values.shape)
+        return np.array([self.adjust_value(v, a) for v, a in zip(current_values.tolist(), adjustments.tolist())],
+                        dtype=float)
+
     @abstractmethod
     def encode_to_storage(self, value: float) -> Any:
         """
@@ -63,6 +138,58 @@ class RelationshipType(ABC):
         """
         pass
 
+    def encode_tags(self, values: np.ndarray) -> np.ndarray:
+        """
+        Compute the RelationshipTag of many values at once.
+
+        Agrees with encode_to_storage and is_neutral: a value is tagged NEUTRAL
+        exactly when is_neutral holds for it. The default goes through
+        encode_to_storage per value.
+
+        Args:
+            values: Array of relationship values
+
+        Returns:
+            int8 array of RelationshipTag values
+        """
+        return np.array([RelationshipTag[self.encode_to_storage(v)] for v in np.asarray(values).tolist()],
+                        dtype=np.int8)
+
+    @staticmethod
+    def storage_names(tags: np.ndarray) -> list:
+        """Turn an array of RelationshipTag values into storage type strings."""
+        return [_TAG_STR[tag] for tag in np.asarray(tags).tolist()]
+
+    def encode_to_storage_array(self, values: np.ndarray) -> np.ndarray:
+        """
+        Encode many relationship values at once into a compact array.
+
+        Args:
+            values: Array of relationship values
+
+        Returns:
+            Array of storage_dtype, one entry per value
+        """
+        return np.asarray(values, dtype=self.storage_dtype)
+
+    def decode_from_storage_array(self, stored_values: np.ndarray) -> np.ndarray:
+        """
+        Decode an array produced by encode_to_storage_array.
+
+        Args:
+            stored_values: Array of encoded values
+
+        Returns:
+            Array of numeric relationship values of this type's dtype, so values
+            loaded from Neo4j keep their full precision
+        """
+        stored_values = np.asarray(stored_values)
+        if stored_values.dtype == object or stored_values.dtype.kind == "U":
+            # Values as loaded from Neo4j, possibly type strings: decode one by one
+            return np.fromiter((self.decode_from_storage(v) for v in stored_values.tolist()),
+                               dtype=self.dtype, count=len(stored_values))
+        return stored_values.astype(self.dtype)
+
     @abstractmethod
     def is_neutral(self, value: float) -> bool:
         """
@@ -76,6 +203,18 @@ class RelationshipType(ABC):
         """
         pass
 
+    def is_neutral_mask(self, values: np.ndarray) -> np.ndarray:
+        """
+        Check many values for neutral/missing at once.
+
+        Args:
+            values: Array of relationship values
+
+        Returns:
+            Boolean array, True where is_neutral holds
+        """
+        return np.array([self.is_neutral(v) for v in np.asarray(values).tolist()], dtype=bool)
+
     @abstractmethod
     def get_name(self) -> str:
         """Return the name of this relationship type."""
@@ -98,11 +237,28 @@ class DiscreteRelationship(RelationshipType):
     Encoded as: POSITIVE=1, NEGATIVE=-1, NEUTRAL=0
     """
 
+    # Values are only ever -1, 0 or 1
+    dtype = np.int8
+    storage_dtype = np.int8
+
+    _DECODE = {"POSITIVE": 1.0, "NEGATIVE": -1.0, "NEUTRAL": 0.0}
+
+    # Candidate values, keyed by the value to exclude (None excludes nothing)
+    _ALL = (1.0, -1.0, 0.0)
+    _CHOICES = {None: _ALL, 1.0: (-1.0, 0.0), -1.0: (1.0, 0.0), 0.0: (1.0, -1.0)}
+
+    def __init__(self):
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
     def get_random_value(self, exclude: Optional[float] = None) -> float:
-        values = [1.0, -1.0, 0.0]
+        values = self._CHOICES.get(exclude, self._ALL)
+        return values[int(random.random() * len(values))]
+
+    def get_random_values(self, n: int, exclude: Optional[float] = None) -> np.ndarray:
+        values = np.array([1.0, -1.0, 0.0])
         if exclude is not None:
-            values = [v for v in values if v != exclude]
-        return random.choice(values)
+            values = values[values != exclude]
+        return self.rng.choice(values, size=n)
 
     def adjust_value(self, current_value: float, adjustment: float) -> float:
         # For discrete, adjustment flips the sign or randomizes
@@ -112,27 +268,45 @@ class DiscreteRelationship(RelationshipType):
         else:
             return -1.0 if current_value >= 0 else 1.0
 
+    def adjust_values(self, current_values: np.ndarray, adjustments: np.ndarray) -> np.ndarray:
+        current_values = np.asarray(current_values)
+        toward_positive = np.asarray(adjustments) > 0
+        # Flip to the other sign, treating neutral as below (positive adjustment) or above (negative)
+        below = np.where(toward_positive, current_values <= 0, current_values < 0)
+        return np.where(below, 1.0, -1.0)
+
     def encode_to_storage(self, value: float) -> str:
-        if value > 0:
-            return "POSITIVE"
-        elif value < 0:
-            return "NEGATIVE"
-        else:
-            return "NEUTRAL"
+        return _TAG_STR[(value > 0) - (value < 0)]
+
+    def encode_tags(self, values: np.ndarray) -> np.ndarray:
+        return np.sign(values).astype(np.int8)
 
     def decode_from_storage(self, stored_value: Any) -> float:
         if isinstance(stored_value, str):
-            if stored_value == "POSITIVE":
-                return 1.0
-            elif stored_value == "NEGATIVE":
-                return -1.0
-            else:
-                return 0.0
+            return self._DECODE.get(stored_value, 0.0)
         return float(stored_value)
 
+    def encode_to_storage_array(self, values: np.ndarray) -> np.ndarray:
+        # One byte per edge: the sign is the whole value
+        return np.sign(values).astype(np.int8)
+
+    def decode_from_storage_array(self, stored_values: np.ndarray) -> np.ndarray:
+        stored_values = np.asarray(stored_values)
+        values = stored_values
+        if stored_values.dtype.kind not in "iuf":
+            values = np.fromiter((self.decode_from_storage(v) for v in stored_values.tolist()),
+                                 dtype=float, count=len(stored_values))
+        # -1/0/+1 fit in a byte; decayed (fractional) values stay floating point
+        if values.dtype.kind == "f" and (values != np.round(values)).any():
+            return values
+        return values.astype(np.int8)
+
     def is_neutral(self, value: float) -> bool:
         return value == 0.0
 
+    def is_neutral_mask(self, values: np.ndarray) -> np.ndarray:
+        return np.asarray(values) == 0
+
     def get_name(self) -> str:
         return "Discrete (Positive/Negative/Neutral)"
 
@@ -157,6 +331,10 @@ class ContinuousRelationship(RelationshipType):
         self.min_val = min_val
         self.max_val = max_val
         self.neutral_threshold = neutral_threshold
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        # Legacy discrete type strings map to the ends of the range
+        self._decode = {"POSITIVE": self.max_val, "NEGATIVE": self.min_val, "NEUTRAL": 0.0}
 
     def get_random_value(self, exclude: Optional[float] = None) -> float:
         # Bimodal distribution to create triangle inequality violations
@@ -170,34 +348,44 @@ class ContinuousRelationship(RelationshipType):
             value = random.uniform(0.6, 0.9)
         return value
 
+    def get_random_values(self, n: int, exclude: Optional[float] = None) -> np.ndarray:
+        # Same bimodal short/long mix as get_random_value: pick each value's mode,
+        # then scale one shared uniform draw into that mode's interval
+        short = self.rng.random(n) < 0.5
+        low = np.where(short, 0.1, 0.6)
+        width = np.where(short, 0.2, 0.3)
+        return low + width * self.rng.random(n)
+
     def adjust_value(self, current_value: float, adjustment: float) -> float:
         # Adjustment adds to current value (clamped to range)
         new_value = current_value + adjustment
         return max(self.min_val, min(self.max_val, new_value))
 
+    def adjust_values(self, current_values: np.ndarray, adjustments: np.ndarray) -> np.ndarray:
+        return np.clip(np.add(current_values, adjustments, dtype=float), self.min_val, self.max_val)
+
     def encode_to_storage(self, value: float) -> str:
         # For continuous values, we still need a type string for Neo4j
         # Store as "POSITIVE" since continuous is positive-only
         # The actual numeric value should be stored as a 'value' property
-        if abs(value) < self.neutral_threshold:
-            return "NEUTRAL"
-        else:
-            return "POSITIVE"
+        return _TAG_STR[RelationshipTag.POSITIVE if abs(value) >= self.neutral_threshold else RelationshipTag.NEUTRAL]
+
+    def encode_tags(self, values: np.ndarray) -> np.ndarray:
+        # Every non-neutral value is POSITIVE, matching encode_to_storage
+        return (np.abs(values) >= self.neutral_threshold).astype(np.int8)
 
     def decode_from_storage(self, stored_value: Any) -> float:
         if isinstance(stored_value, str):
             # Legacy compatibility: convert old discrete types
-            if stored_value == "POSITIVE":
-                return self.max_val
-            elif stored_value == "NEGATIVE":
-                return self.min_val
-            else:
-                return 0.0
+            return self._decode.get(stored_value, 0.0)
         return float(stored_value)
 
     def is_neutral(self, value: float) -> bool:
         return abs(value) < self.neutral_threshold
 
+    def is_neutral_mask(self, values: np.ndarray) -> np.ndarray:
+        return np.abs(values) < self.neutral_threshold
+
     def get_name(self) -> str:
         return f"Continuous [{self.min_val}, {self.max_val}]"
 
@@ -208,6 +396,54 @@ class ContinuousRelationship(RelationshipType):
         return True
 
 
+class QuantizedContinuous(ContinuousRelationship):
+    """
+    Continuous relationship values snapped to 127 levels per unit of the range.
+
+    Values stay on a grid of max_val / 127, so arrays of them encode exactly
+    into one int8 per edge (4x smaller than float32) for transport and bulk
+    sweeps. Use ContinuousRelationship where full float precision matters.
+    """
+
+    # Number of quantization steps between zero and the largest magnitude
+    LEVELS = 127
+
+    storage_dtype = np.int8
+
+    def __init__(self, min_val: float = 0.0, max_val: float = 1.0, neutral_threshold: float = 0.01):
+        super().__init__(min_val, max_val, neutral_threshold)
+        self._step = max(abs(min_val), abs(max_val)) / self.LEVELS
+
+    def quantize(self, value: float) -> float:
+        """Snap a value to the nearest quantization level."""
+        return round(value / self._step) * self._step
+
+    def get_random_value(self, exclude: Optional[float] = None) -> float:
+        return self.quantize(super().get_random_value(exclude))
+
+    def get_random_values(self, n: int, exclude: Optional[float] = None) -> np.ndarray:
+        return np.round(super().get_random_values(n, exclude) / self._step) * self._step
+
+    def adjust_value(self, current_value: float, adjustment: float) -> float:
+        return self.quantize(super().adjust_value(current_value, adjustment))
+
+    def adjust_values(self, current_values: np.ndarray, adjustments: np.ndarray) -> np.ndarray:
+        return np.round(super().adjust_values(current_values, adjustments) / self._step) * self._step
+
+    def encode_to_storage_array(self, values: np.ndarray) -> np.ndarray:
+        clipped = np.clip(values, self.min_val, self.max_val)
+        return np.round(clipped / self._step).astype(np.int8)
+
+    def decode_from_storage_array(self, stored_values: np.ndarray) -> np.ndarray:
+        stored_values = np.asarray(stored_values)
+        if stored_values.dtype == np.int8:
+            return stored_values.astype(self.dtype) * self._step
+        return super().decode_from_storage_array(stored_values)
+
+    def get_name(self) -> str:
+        return f"Quantized Continuous [{self.min_val}, {self.max_val}]"
+
+
 class BipolarRelationship(RelationshipType):
     """
     Continuous bipolar relationship values in range [-max, +max].
@@ -222,6 +458,10 @@ class BipolarRelationship(RelationshipType):
         self.max_val = max_val
         self.min_val = -max_val
         self.neutral_threshold = neutral_threshold
+        self.rng = np.random.default_rng(random.getrandbits(64))
+
+        # Legacy discrete type strings map to the ends of the range
+        self._decode = {"POSITIVE": self.max_val, "NEGATIVE": self.min_val, "NEUTRAL": 0.0}
 
     def get_random_value(self, exclude: Optional[float] = None) -> float:
         # Generate random value, avoiding neutral zone
@@ -233,35 +473,46 @@ class BipolarRelationship(RelationshipType):
             value = random.uniform(self.min_val, -self.neutral_threshold)
         return value
 
+    def get_random_values(self, n: int, exclude: Optional[float] = None) -> np.ndarray:
+        # A magnitude outside the neutral zone with a random sign, as in get_random_value
+        sign = self.rng.choice([-1.0, 1.0], size=n)
+        return sign * self.rng.uniform(self.neutral_threshold, self.max_val, n)
+
+    def get_random_negative_values(self, n: int) -> np.ndarray:
+        # The negative half of get_random_values: uniform on [min_val, -neutral_threshold)
+        return -self.rng.uniform(self.neutral_threshold, self.max_val, n)
+
     def adjust_value(self, current_value: float, adjustment: float) -> float:
         # Positive adjustment moves toward positive, negative toward negative
         new_value = current_value + adjustment
         return max(self.min_val, min(self.max_val, new_value))
 
+    def adjust_values(self, current_values: np.ndarray, adjustments: np.ndarray) -> np.ndarray:
+        return np.clip(np.add(current_values, adjustments, dtype=float), self.min_val, self.max_val)
+
     def encode_to_storage(self, value: float) -> str:
         # For bipolar values, we still need a type string for Neo4j
         # The actual numeric value should be stored as a 'value' property
         if abs(value) < self.neutral_threshold:
             return "NEUTRAL"
-        elif value > 0:
-            return "POSITIVE"
-        else:
-            return "NEGATIVE"
+        return _TAG_STR[(value > 0) - (value < 0)]
+
+    def encode_tags(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values)
+        return np.where(np.abs(values) < self.neutral_threshold, 0, np.sign(values)).astype(np.int8)
 
     def decode_from_storage(self, stored_value: Any) -> float:
         if isinstance(stored_value, str):
             # Legacy compatibility: convert old discrete types
-            if stored_value == "POSITIVE":
-                return self.max_val
-            elif stored_value == "NEGATIVE":
-                return self.min_val
-            else:
-                return 0.0
+            return self._decode.get(stored_value, 0.0)
         return float(stored_value)
 
     def is_neutral(self, value: float) -> bool:
         return abs(value) < self.neutral_threshold
 
+    def is_neutral_mask(self, values: np.ndarray) -> np.ndarray:
+        return np.abs(values) < self.neutral_threshold
+
     def get_name(self) -> str:
         return f"Bipolar [-{self.max_val}, +{self.max_val}]"
 
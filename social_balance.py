@@ -1,13 +1,71 @@
 import random
+import hashlib
+from collections import OrderedDict, deque
 import numpy as np
 from database import Neo4jConnection
+from graph_mirror import GraphMirror, TriangleRows
 from typing import Optional
-from models.balance_rules import BalanceRule, ClassicBalanceRule
-from models.action_strategies import ActionStrategy, ClassicActionStrategy
+from models.balance_rules import BalanceRule, ClassicBalanceRule, BALANCED, UNBALANCED
+from models.action_strategies import ActionStrategy, ClassicActionStrategy, ActionKind
 from models.relationship_types import RelationshipType, DiscreteRelationship
 from models.mechanisms import DecayMechanism, NoDecay
-from sklearn.manifold import MDS
-from sklearn.decomposition import PCA
+from scipy.linalg import eigh
+from scipy.spatial.distance import pdist
+
+
+def classical_mds(distance_matrix, n_components):
+    """
+    Classical (Torgerson) MDS: embed points so their distances approximate distance_matrix.
+
+    Closed form, via the top eigenvectors of the double-centered squared distance
+    matrix, rather than SMACOF's iterative stress minimization.
+
+    Args:
+        distance_matrix: Symmetric (n, n) matrix of distances
+        n_components: Number of dimensions to embed into (at most n)
+
+    Returns:
+        Tuple (coordinates, eigenvalues): an (n, n_components) array with the
+        largest-variance axis first, and the matching eigenvalues (each axis's
+        share of the variance, up to normalization)
+    """
+    squared = np.asarray(distance_matrix, dtype=float) ** 2
+    # -1/2 J D^2 J without forming J: subtract row and column means, add back the grand mean
+    row_means = squared.mean(axis=1)
+    gram = -0.5 * (squared - row_means[:, None] - row_means[None, :] + row_means.mean())
+
+    n = len(gram)
+    eigenvalues, eigenvectors = eigh(gram, subset_by_index=[n - n_components, n - 1])
+    eigenvalues, eigenvectors = eigenvalues[::-1], eigenvectors[:, ::-1]
+    eigenvalues = np.maximum(eigenvalues, 0.0)
+    return eigenvectors * np.sqrt(eigenvalues), eigenvalues
+
+
+class SimulationHistory:
+    """
+    Bounded record of per-iteration statistics.
+
+    Keeps the last `window` entries in full plus every `sample_every`-th entry
+    over the whole run, so long simulations don't accumulate every stats dict.
+    """
+
+    def __init__(self, window=1000, sample_every=10):
+        self.recent = deque(maxlen=window)
+        self.samples = []
+        self.sample_every = sample_every
+        self.count = 0
+
+    def append(self, stats):
+        if self.count % self.sample_every == 0:
+            self.samples.append((self.count, stats))
+        self.recent.append((self.count, stats))
+        self.count += 1
+
+    def to_list(self):
+        """Return sampled older entries followed by the recent window, in iteration order"""
+        first_recent = self.recent[0][0] if self.recent else self.count
+        older = [stats for i, stats in self.samples if i < first_recent]
+        return older + [stats for _, stats in self.recent]
 
 
 class SocialBalanceModel:
@@ -23,9 +81,20 @@ class SocialBalanceModel:
         balance_rule: Optional[BalanceRule] = None,
         action_strategy: Optional[ActionStrategy] = None,
         relationship_type: Optional[RelationshipType] = None,
-        decay: Optional[DecayMechanism] = None
+        decay: Optional[DecayMechanism] = None,
+        seed: Optional[int] = None,
+        apply_decay_each_iteration: bool = False
     ):
+        """
+        Args:
+            seed: Seed for every random draw of a run, so runs can be reproduced;
+                if None, draws follow the state of Python's random module
+            apply_decay_each_iteration: Decay every relationship by one step at the
+                end of each iteration. Off by default: it rewrites every decayed edge
+                in Neo4j on every iteration and changes how simulations converge
+        """
         self.db = db
+        self.apply_decay_each_iteration = apply_decay_each_iteration
 
         # Use dependency injection with defaults for backward compatibility
         self.balance_rule = balance_rule or ClassicBalanceRule()
@@ -33,6 +102,30 @@ class SocialBalanceModel:
         self.relationship_type = relationship_type or DiscreteRelationship()
         self.decay = decay or NoDecay()
 
+        # Statistics of the current graph, and its triangles with their balance
+        # status; both cleared whenever this model writes to it
+        self._stats_cache = None
+        self._triangle_cache = None
+
+        # In-process copy of the graph, loaded lazily and updated alongside every write.
+        # This model must be the graph's only writer: nothing refreshes the copy when
+        # another process changes Neo4j (which is why app.py runs a single worker)
+        self._graph = None
+
+        # MDS/PCA results keyed by graph-content digest (see get_graph_data_mds)
+        self._mds_cache = OrderedDict()
+        self._mds_cache_size = 8
+
+        # Source of the draws that are taken in bulk (initial edges, who acts each
+        # iteration, the strategy's and relationship type's batch draws). It is
+        # derived from Python's random module, which the per-triangle helpers use,
+        # so a single seed reproduces a whole run
+        if seed is not None:
+            random.seed(seed)
+        self.rng = np.random.default_rng(random.getrandbits(64))
+        self.action_strategy.rng = self.rng
+        self.relationship_type.rng = self.rng
+
     async def initialize_random_graph(self, num_people, positive_prob=0.3, negative_prob=0.3):
         """
         Create a random graph with specified probabilities for relationship types.
@@ -48,75 +141,48 @@ class SocialBalanceModel:
         await self.db.clear_database()
         print(f"Database cleared")
 
-        # Create person nodes
-        print(f"Creating {num_people} person nodes...")
-        for i in range(num_people):
-            await self.db.create_person(i)
-        print(f"Created {num_people} person nodes")
-
-        # Create relationships between all pairs (batched for performance)
+        # Build relationships between all pairs; nodes and edges are written together below
         print(f"Creating relationships...")
-        relationships = []
-
-        print(f"[DEBUG] Starting relationship loop for {num_people} people...")
-        for i in range(num_people):
-            for j in range(i + 1, num_people):
-                rand_val = random.random()
-
-                if rand_val < positive_prob:
-                    # Create positive edge - use appropriate positive value for the relationship type
-                    if isinstance(self.relationship_type, DiscreteRelationship):
-                        value = 1.0
-                    else:
-                        # For continuous/bipolar, get a random positive value
-                        value = self.relationship_type.get_random_value()
-
-                    rel_type = self.relationship_type.encode_to_storage(value)
-                    relationships.append({
-                        "person1_id": i,
-                        "person2_id": j,
-                        "rel_type": rel_type,
-                        "value": value
-                    })
-
-                elif rand_val < positive_prob + negative_prob:
-                    # Create negative edge - use appropriate negative value for the relationship type
-                    if isinstance(self.relationship_type, DiscreteRelationship):
-                        value = -1.0
-                        rel_type = self.relationship_type.encode_to_storage(value)
-                        relationships.append({
-                            "person1_id": i,
-                            "person2_id": j,
-                            "rel_type": rel_type,
-                            "value": value
-                        })
-                    elif hasattr(self.relationship_type, 'min_val') and self.relationship_type.min_val < 0:
-                        # Only BipolarRelationship supports negative values
-                        # For bipolar, get a random negative value
-                        value = self.relationship_type.get_random_value()
-                        # Ensure it's negative
-                        while value >= 0:
-                            value = self.relationship_type.get_random_value()
-
-                        rel_type = self.relationship_type.encode_to_storage(value)
-                        relationships.append({
-                            "person1_id": i,
-                            "person2_id": j,
-                            "rel_type": rel_type,
-                            "value": value
-                        })
-                    # else: ContinuousRelationship doesn't support negative values, skip
-                # else: NEUTRAL - no relationship created
-
-        print(f"[DEBUG] Finished loop, built {len(relationships)} relationships")
-        print("Creating relationships batch")
-        # Batch create all relationships at once
-        if relationships:
-            print(f"[DEBUG] About to call create_relationships_batch with {len(relationships)} items")
-            await self.db.create_relationships_batch(relationships)
-            print(f"[DEBUG] Batch call completed")
-
-        print(f"Created {len(relationships)} relationships")
+        person1, person2 = np.triu_indices(num_people, k=1)
+        rand = self.rng.random(len(person1))
+        positive = rand < positive_prob
+        negative = (rand >= positive_prob) & (rand < positive_prob + negative_prob)
+
+        # What the relationship type supports, asked once through its interface
+        is_continuous = self.relationship_type.is_continuous()
+        supports_negative = self.relationship_type.get_range()[0] < 0
+
+        values = np.zeros(len(person1))
+        if not is_continuous:
+            values[positive] = 1.0
+            values[negative] = -1.0
+        else:
+            # For continuous/bipolar, a random positive value for the relationship type
+            values[positive] = self.relationship_type.get_random_values(int(positive.sum()))
+            if supports_negative:
+                # Only BipolarRelationship supports negative values
+                values[negative] = self.relationship_type.get_random_negative_values(int(negative.sum()))
+            else:
+                # ContinuousRelationship doesn't support negative values, skip
+                negative[:] = False
+
+        # Anything else is NEUTRAL - no relationship created
+        created = np.flatnonzero(positive | negative)
+        rel_types = self.relationship_type.storage_names(self.relationship_type.encode_tags(values[created]))
+        relationships = [
+            {"person1_id": i, "person2_id": j, "rel_type": rel_type, "value": value}
+            for i, j, rel_type, value in zip(person1[created].tolist(), person2[created].tolist(),
+                                              rel_types, values[created].tolist())
+        ]
+
+        # Batch create all person nodes and relationships in one transaction
+        await self.db.initialize_graph_batch(list(range(num_people)), relationships)
+        self._stats_cache = None
+        self._triangle_cache = None
+        self._graph = GraphMirror(range(num_people), self.relationship_type.dtype)
+        self._graph.set_edges(person1[created], person2[created], rel_types, values[created])
+
+        print(f"Created {num_people} person nodes and {len(relationships)} relationships")
         print(f"Initialized graph with {num_people} people using {self.relationship_type.get_name()}")
 
     def is_triangle_balanced(self, edge_types):
@@ -166,32 +232,33 @@ class SocialBalanceModel:
             "new_type": new_type
         }
 
-    async def _execute_action(self, action):
+    def _plan_action(self, action):
         """
-        Execute an action returned by the action strategy.
+        Translate an action returned by the action strategy into a database write.
 
         Args:
-            action: Dictionary describing the action
+            action: ChangeEdgeAction, CreateEdgeAction or DeleteEdgeAction
 
         Returns:
-            Dictionary describing the change made
+            Tuple (change, write): change describes the change made and write is a
+            dict for Neo4jConnection.apply_relationship_changes; (None, None) if no change
         """
-        action_type = action.get("type")
-
-        if action_type == "change_edge":
-            person1 = action["person1"]
-            person2 = action["person2"]
-            new_value = action["new_value"]
-            old_value = action.get("old_value")
+        action_type = action.type
 
-            # Encode the new value for storage
-            new_type = self.relationship_type.encode_to_storage(new_value)
+        if action_type is ActionKind.CHANGE:
+            person1 = action.person1
+            person2 = action.person2
+            new_value = action.new_value
+            old_value = action.old_value
 
             # Check if it's neutral (delete edge)
             if self.relationship_type.is_neutral(new_value):
-                await self.db.delete_relationship(person1, person2)
+                write = {"op": "delete", "person1_id": person1, "person2_id": person2}
             else:
-                await self.db.update_relationship(person1, person2, new_type, value=new_value)
+                # Encode the new value for storage
+                new_type = self.relationship_type.encode_to_storage(new_value)
+                write = {"op": "update", "person1_id": person1, "person2_id": person2,
+                         "rel_type": new_type, "value": new_value}
 
             return {
                 "action": "change_edge",
@@ -199,37 +266,43 @@ class SocialBalanceModel:
                 "person2": person2,
                 "old_value": old_value,
                 "new_value": new_value
-            }
+            }, write
+
+        elif action_type is ActionKind.CREATE:
+            person1 = action.person1
+            person2 = action.person2
+            new_value = action.new_value
 
-        elif action_type == "create_edge":
-            person1 = action["person1"]
-            person2 = action["person2"]
-            new_value = action["new_value"]
+            # A neutral relationship is the absence of an edge, so never store one;
+            # this keeps NEUTRAL-typed edges out of every triangle expansion
+            if self.relationship_type.is_neutral(new_value):
+                return None, None
 
             # Encode for storage
             new_type = self.relationship_type.encode_to_storage(new_value)
-            await self.db.create_relationship(person1, person2, new_type, value=new_value)
+            write = {"op": "create", "person1_id": person1, "person2_id": person2,
+                     "rel_type": new_type, "value": new_value}
 
             return {
                 "action": "create_edge",
                 "person1": person1,
                 "person2": person2,
                 "new_value": new_value
-            }
+            }, write
 
-        elif action_type == "delete_edge":
-            person1 = action["person1"]
-            person2 = action["person2"]
+        elif action_type is ActionKind.DELETE:
+            person1 = action.person1
+            person2 = action.person2
 
-            await self.db.delete_relationship(person1, person2)
+            write = {"op": "delete", "person1_id": person1, "person2_id": person2}
 
             return {
                 "action": "delete_edge",
                 "person1": person1,
                 "person2": person2
-            }
+            }, write
 
-        return None
+        return None, None
 
     async def run_single_iteration(self, action_probability=0.5):
         """
@@ -241,64 +314,118 @@ class SocialBalanceModel:
         Returns:
             Dictionary with iteration results
         """
-        # Get all people
-        people_query = "MATCH (p:Person) RETURN p.id as id"
-        people = await self.db.execute_query(people_query)
-        person_ids = [p["id"] for p in people]
-
-        changes_made = []
-
-        for person_id in person_ids:
-            # Get all triangles this person is part of
-            triangles = await self.db.get_person_triangles(person_id)
-
-            if not triangles:
-                # No triangles at all - do nothing
-                continue
-
-            # Find unbalanced triangles
-            unbalanced = []
-            for triangle in triangles:
-                edge_types = [triangle["e1"], triangle["e2"], triangle["e3"]]
-                is_balanced = self.is_triangle_balanced(edge_types)
-
-                if is_balanced is False:  # Explicitly unbalanced
-                    unbalanced.append(triangle)
-
-            if not unbalanced:
-                # Not in any unbalanced triangles - do nothing
-                continue
-
-            # Person is in at least one unbalanced triangle
-            # Person acts with given probability
-            if random.random() > action_probability:
-                continue
-
-            # Get neighbors of neighbors for potential new connections
-            neighbors_of_neighbors = await self.db.get_neighbors_of_neighbors(person_id)
-
-            # Use the action strategy to select an action
-            action = self.action_strategy.select_action(
-                person_id,
-                unbalanced,
-                neighbors_of_neighbors,
-                self.relationship_type
-            )
-
+        graph = await self._get_graph()
+        person_ids = list(graph.person_ids)
+
+        # Everyone decides based on the graph as it was at the start of the
+        # iteration; writes (and the changes they make) are collected per pair,
+        # last one wins, and applied in a single transaction at the end
+        pending_writes = {}
+        pending_changes = {}
+
+        # Classify every triangle at once (usually already done for the previous
+        # iteration's statistics) and index the unbalanced ones by member
+        triangles, status = await self._get_triangle_status()
+        unbalanced_by_person = triangles.rows_by_person(np.flatnonzero(status == UNBALANCED))
+
+        # Only people in at least one unbalanced triangle may act, each with the
+        # given probability; all of those coin flips are drawn at once
+        candidates = [person_id for person_id in person_ids if person_id in unbalanced_by_person]
+        acts = (self.rng.random(len(candidates)) <= action_probability).tolist()
+
+        acting = [person_id for person_id, person_acts in zip(candidates, acts) if person_acts]
+
+        # Get neighbors of neighbors for potential new connections, unless the
+        # strategy never creates edges
+        if self.action_strategy.requires_neighbors_of_neighbors and acting:
+            neighbors_by_person = await self.db.get_neighbors_of_neighbors_batch(acting)
+            neighbors_per_person = [neighbors_by_person.get(person_id, []) for person_id in acting]
+        else:
+            neighbors_per_person = [[] for _ in acting]
+
+        # Triangle dicts (with the acting person as n1) are only built when accessed
+        unbalanced_per_person = [
+            TriangleRows(triangles, unbalanced_by_person[person_id], person_id) for person_id in acting
+        ]
+
+        # Use the action strategy to select everyone's action in one call
+        actions = self.action_strategy.select_actions_batch(
+            acting,
+            unbalanced_per_person,
+            neighbors_per_person,
+            self.relationship_type
+        )
+
+        for action in actions:
             if action:
-                # Execute the action
-                change = await self._execute_action(action)
+                change, write = self._plan_action(action)
                 if change:
-                    changes_made.append(change)
+                    pair = tuple(sorted((write["person1_id"], write["person2_id"])))
+                    pending_writes[pair] = write
+                    pending_changes[pair] = change
+
+        if pending_writes:
+            await self.db.apply_relationship_changes(list(pending_writes.values()))
+            self._stats_cache = None
+            self._triangle_cache = None
+            if self._graph is not None:
+                self._graph.apply_changes(pending_writes.values())
+
+        # If enabled, relationships then weaken by one step of the configured decay
+        decayed = await self.apply_decay() if self.apply_decay_each_iteration else 0
 
         stats = await self.get_statistics()
 
+        # Only the changes that were actually written, one per pair
+        changes_made = list(pending_changes.values())
+
         return {
             "changes_made": len(changes_made),
             "changes": changes_made,
+            "decayed": decayed,
             "stats": stats
         }
 
+    async def apply_decay(self, steps=1):
+        """
+        Decay every relationship using the configured decay mechanism.
+
+        Called at the end of every iteration if apply_decay_each_iteration is set. All edges are decayed in one vectorized call; edges that reach neutral are
+        deleted and the rest updated, in a single write transaction.
+
+        Args:
+            steps: Number of decay steps to catch up on at once (computed in closed
+                form, so several iterations' worth costs the same as one)
+
+        Returns:
+            Number of relationships changed
+        """
+        graph = await self._get_graph()
+        person1_ids, person2_ids, values, ages = graph.get_edges()
+        decayed = self.decay.apply_decay_array(values, self.relationship_type, steps, ages)
+        graph.clock += steps
+        changed = np.flatnonzero(decayed != values)
+        tags = self.relationship_type.encode_tags(decayed[changed])
+
+        changes = []
+        for person1, person2, value, rel_type in zip(person1_ids[changed].tolist(), person2_ids[changed].tolist(),
+                                                     decayed[changed].tolist(),
+                                                     self.relationship_type.storage_names(tags)):
+            if rel_type == "NEUTRAL":
+                changes.append({"op": "delete", "person1_id": person1, "person2_id": person2})
+            else:
+                changes.append({"op": "update", "person1_id": person1, "person2_id": person2,
+                                "rel_type": rel_type, "value": value})
+
+        if changes:
+            await self.db.apply_relationship_changes(changes)
+            self._stats_cache = None
+            self._triangle_cache = None
+            # Decay doesn't restart an edge's age, only actions setting it do
+            graph.apply_changes(changes, keep_age=True)
+
+        return len(changes)
+
     async def run_simulation(self, max_iterations=100, action_probability=0.5):
         """
         Run the simulation until all triangles are balanced or max iterations reached.
@@ -307,11 +434,13 @@ class SocialBalanceModel:
             Dictionary with simulation results
         """
         iteration_count = 0
-        history = []
+        history = SimulationHistory()
         no_change_streak = 0
 
+        # run_single_iteration returns fresh stats, so only fetch them once here
+        stats = await self.get_statistics()
+
         for i in range(max_iterations):
-            stats = await self.get_statistics()
             history.append(stats)
 
             # Check if all triangles are balanced
@@ -322,6 +451,7 @@ class SocialBalanceModel:
             # Run one iteration
             result = await self.run_single_iteration(action_probability)
             iteration_count += 1
+            stats = result["stats"]
 
             # Track consecutive iterations with no changes
             if result["changes_made"] == 0:
@@ -335,57 +465,31 @@ class SocialBalanceModel:
                 print(f"Stable state reached after {i} iterations (10 iterations with no changes)")
                 break
 
-        final_stats = await self.get_statistics()
-
         return {
             "iterations": iteration_count,
-            "final_stats": final_stats,
-            "history": history,
-            "converged": final_stats["unbalanced_triangles"] == 0
+            "final_stats": stats,
+            "history": history.to_list(),
+            "converged": stats["unbalanced_triangles"] == 0
         }
 
     async def get_statistics(self):
-        """Get current graph statistics"""
-        # Count nodes
-        num_people = await self.db.count_nodes()
+        """Get current graph statistics (cached until the graph is modified)"""
+        if self._stats_cache is not None:
+            return self._stats_cache
 
-        # Count relationships by type
-        rel_counts = await self.db.count_relationships()
-        rel_stats = {r["type"]: int(r["count"]) for r in rel_counts}
+        # Counted from the in-process graph copy rather than a Cypher pattern match
+        graph = await self._get_graph()
+        num_people = graph.count_nodes()
+        rel_stats = graph.count_relationships()
 
-        # Count triangles
-        triangles = await self.db.get_triangles()
+        # Classify all triangles in one vectorized pass (mirror values are already decoded)
+        triangles, status = await self._get_triangle_status()
         total_triangles = len(triangles)
 
-        balanced_count = 0
-        unbalanced_count = 0
-
-        for triangle in triangles:
-            edge_types = [triangle["e1"], triangle["e2"], triangle["e3"]]
-            is_balanced = self.is_triangle_balanced(edge_types)
-
-            if is_balanced is True:
-                balanced_count += 1
-            elif is_balanced is False:
-                unbalanced_count += 1
-
-        # Debug: Print a few sample triangles to verify balance
-        if triangles and balanced_count > 0:
-            print(f"\n[DEBUG] Sample balanced triangles:")
-            sample_count = 0
-            for triangle in triangles:
-                edge_types = [triangle["e1"], triangle["e2"], triangle["e3"]]
-                is_balanced = self.is_triangle_balanced(edge_types)
-                if is_balanced and sample_count < 3:
-                    e1, e2, e3 = edge_types
-                    print(f"  Triangle ({triangle['n1']}, {triangle['n2']}, {triangle['n3']}): e1={e1}, e2={e2}, e3={e3}")
-                    if isinstance(e1, float) and isinstance(e2, float) and isinstance(e3, float):
-                        print(f"    Check: {e1:.3f}+{e2:.3f}={e1+e2:.3f} >= {e3:.3f}? {e1+e2 >= e3}")
-                        print(f"    Check: {e2:.3f}+{e3:.3f}={e2+e3:.3f} >= {e1:.3f}? {e2+e3 >= e1}")
-                        print(f"    Check: {e3:.3f}+{e1:.3f}={e3+e1:.3f} >= {e2:.3f}? {e3+e1 >= e2}")
-                    sample_count += 1
+        balanced_count = int(np.count_nonzero(status == BALANCED))
+        unbalanced_count = int(np.count_nonzero(status == UNBALANCED))
 
-        return {
+        self._stats_cache = {
             "num_people": num_people,
             "relationships": rel_stats,
             "total_triangles": total_triangles,
@@ -393,44 +497,48 @@ class SocialBalanceModel:
             "unbalanced_triangles": unbalanced_count,
             "balance_ratio": balanced_count / total_triangles if total_triangles > 0 else 0
         }
+        return self._stats_cache
+
+    async def _get_triangle_status(self):
+        """
+        Return the current graph's triangles and their balance status.
+
+        Computed once per graph state and shared by the iteration, the statistics
+        and the node status until this model next writes to the graph.
+
+        Returns:
+            Tuple (TriangleBatch, array of BALANCED/UNBALANCED/INCOMPLETE per row)
+        """
+        if self._triangle_cache is None:
+            graph = await self._get_graph()
+            triangles = graph.get_triangle_batch()
+            self._triangle_cache = (triangles, self.balance_rule.is_balanced_batch(triangles.edges))
+        return self._triangle_cache
+
+    async def _get_graph(self):
+        """Return the in-process graph copy, loading it from Neo4j on first use"""
+        if self._graph is None:
+            nodes_and_edges = await self.db.get_all_nodes_and_edges()
+            self._graph = GraphMirror.from_records(nodes_and_edges, self.relationship_type.decode_from_storage_array,
+                                                   self.relationship_type.dtype)
+        return self._graph
 
     async def get_node_triangle_status(self):
         """Classify each node based on their triangle participation.
         Returns dict: {person_id: 'unbalanced' | 'balanced' | 'none'}
         """
-        # Get all people
-        people_query = "MATCH (p:Person) RETURN p.id as id"
-        people = await self.db.execute_query(people_query)
+        graph = await self._get_graph()
 
         # Initialize all as having no triangles
-        node_status = {p["id"]: "none" for p in people}
-
-        # Check each person's triangles
-        for person_id in node_status.keys():
-            triangles = await self.db.get_person_triangles(person_id)
+        node_status = {person_id: "none" for person_id in graph.person_ids}
 
-            if not triangles:
-                continue  # No triangles - stays 'none'
+        triangles, status = await self._get_triangle_status()
 
-            # Check if any triangle is unbalanced
-            has_unbalanced = False
-            has_balanced = False
-
-            for triangle in triangles:
-                edge_types = [triangle["e1"], triangle["e2"], triangle["e3"]]
-                is_balanced = self.is_triangle_balanced(edge_types)
-
-                if is_balanced is False:
-                    has_unbalanced = True
-                    break  # If even one is unbalanced, mark as unbalanced
-                elif is_balanced is True:
-                    has_balanced = True
-
-            # Priority: unbalanced > balanced > none
-            if has_unbalanced:
-                node_status[person_id] = "unbalanced"
-            elif has_balanced:
-                node_status[person_id] = "balanced"
+        # Priority: unbalanced > balanced > none
+        for person_id in np.unique(triangles.nodes[status == BALANCED]).tolist():
+            node_status[person_id] = "balanced"
+        for person_id in np.unique(triangles.nodes[status == UNBALANCED]).tolist():
+            node_status[person_id] = "unbalanced"
 
         return node_status
 
@@ -485,6 +593,9 @@ class SocialBalanceModel:
     async def reset_graph(self):
         """Clear the entire graph"""
         await self.db.clear_database()
+        self._stats_cache = None
+        self._triangle_cache = None
+        self._graph = GraphMirror(dtype=self.relationship_type.dtype)
 
     async def get_graph_data_mds(self):
         """
@@ -494,12 +605,50 @@ class SocialBalanceModel:
             Dictionary with nodes (with x,y from MDS), links, PCA info, and compromise info
         """
         nodes_and_edges = await self.db.get_all_nodes_and_edges()
+
+        # Layout only depends on graph content, so reuse it while nothing changed
+        digest = self._graph_digest(nodes_and_edges)
+        if digest in self._mds_cache:
+            self._mds_cache.move_to_end(digest)
+            return dict(self._mds_cache[digest])
+
+        result = await self._compute_graph_data_mds(nodes_and_edges)
+
+        self._mds_cache[digest] = result
+        if len(self._mds_cache) > self._mds_cache_size:
+            self._mds_cache.popitem(last=False)
+
+        return dict(result)
+
+    @staticmethod
+    def _graph_digest(nodes_and_edges):
+        """Hash nodes and (source, target, type, value, initial_value) edges of a graph snapshot"""
+        entries = []
+        for record in nodes_and_edges:
+            p = record["p"]
+            if record["r"] and record["p2"]:
+                rel = record["r"]
+                entries.append((p["id"], record["p2"]["id"], rel["type"], rel.get("value"), rel.get("initial_value")))
+            else:
+                entries.append((p["id"],))
+
+        h = hashlib.blake2b(digest_size=16)
+        for entry in sorted(entries, key=repr):
+            h.update(repr(entry).encode())
+        return h.hexdigest()
+
+    async def _compute_graph_data_mds(self, nodes_and_edges):
+        """Compute MDS layout, PCA info and compromise info for a graph snapshot"""
         node_status = await self.get_node_triangle_status()
 
-        # Build node list and distance matrix
+        # Build the node list, links and edge distances in a single pass over the
+        # records; edges are kept by person id until every node has its index
         nodes_dict = {}
         node_id_to_idx = {}
-        idx = 0
+        links = []
+        edge_src_ids = []
+        edge_dst_ids = []
+        edge_weights = []
 
         for record in nodes_and_edges:
             p = record["p"]
@@ -510,21 +659,9 @@ class SocialBalanceModel:
                     "name": p["name"],
                     "status": node_status.get(person_id, "none")
                 }
-                node_id_to_idx[person_id] = idx
-                idx += 1
-
-        n_nodes = len(nodes_dict)
+                node_id_to_idx[person_id] = len(node_id_to_idx)
 
-        # Initialize distance matrix with large values (for missing edges)
-        # Using a large value instead of inf to avoid MDS issues
-        distance_matrix = np.full((n_nodes, n_nodes), 10.0)
-        np.fill_diagonal(distance_matrix, 0)
-
-        # Fill in actual edge distances
-        links = []
-        for record in nodes_and_edges:
             if record["r"] and record["p2"]:
-                p1_id = record["p"]["id"]
                 p2_id = record["p2"]["id"]
                 rel = record["r"]
 
@@ -532,12 +669,10 @@ class SocialBalanceModel:
                     edge_value = rel.get("value")
                     initial_value = rel.get("initial_value", edge_value)
 
-                    # Update distance matrix
                     if edge_value is not None:
-                        i = node_id_to_idx[p1_id]
-                        j = node_id_to_idx[p2_id]
-                        distance_matrix[i, j] = edge_value
-                        distance_matrix[j, i] = edge_value
+                        edge_src_ids.append(person_id)
+                        edge_dst_ids.append(p2_id)
+                        edge_weights.append(edge_value)
 
                     # Calculate change
                     change = None
@@ -545,7 +680,7 @@ class SocialBalanceModel:
                         change = edge_value - initial_value
 
                     links.append({
-                        "source": p1_id,
+                        "source": person_id,
                         "target": p2_id,
                         "type": rel["type"],
                         "value": edge_value,
@@ -553,6 +688,22 @@ class SocialBalanceModel:
                         "change": change
                     })
 
+        n_nodes = len(nodes_dict)
+
+        # Initialize distance matrix with large values (for missing edges)
+        # Using a large value instead of inf to avoid MDS issues
+        # float32 is plenty for a screen layout
+        distance_matrix = np.full((n_nodes, n_nodes), 10.0, dtype=np.float32)
+        np.fill_diagonal(distance_matrix, 0)
+
+        # Scatter the actual edge distances into the matrix in one go
+        if edge_weights:
+            src = np.array([node_id_to_idx[pid] for pid in edge_src_ids], dtype=np.intp)
+            dst = np.array([node_id_to_idx[pid] for pid in edge_dst_ids], dtype=np.intp)
+            weights = np.array(edge_weights, dtype=np.float32)
+            distance_matrix[src, dst] = weights
+            distance_matrix[dst, src] = weights
+
         # Compute MDS if we have enough nodes
         if n_nodes < 2:
             # Not enough nodes for MDS, return empty
@@ -563,24 +714,21 @@ class SocialBalanceModel:
                 "compromise_info": None
             }
 
-        # Apply MDS directly to 2D for best distance preservation
-        mds = MDS(n_components=2, dissimilarity='precomputed', random_state=42, metric=True)
-        coords_2d = mds.fit_transform(distance_matrix)
-
-        print(f"[DEBUG] MDS stress: {mds.stress_}")
+        # One classical MDS gives both the 2D layout and the variance spectrum of
+        # the first (up to) 5 dimensions
+        n_spectrum = min(n_nodes - 1, 5)
+        coords, eigenvalues = classical_mds(distance_matrix, max(n_spectrum, 2))
+        coords_2d = coords[:, :2]
 
-        # Compute actual distances in MDS coordinates
-        from scipy.spatial.distance import pdist, squareform
-        mds_dist_matrix = squareform(pdist(coords_2d))
+        # Compute actual distances in MDS coordinates (condensed: pairs i < j in
+        # np.triu_indices order, which is all the scale factor needs)
+        mds_distances = pdist(coords_2d)
 
         # Find the scale factor: compare MDS distances to input distances for actual edges
-        scale_sum_input = 0
-        scale_sum_mds = 0
-        for i in range(n_nodes):
-            for j in range(i + 1, n_nodes):
-                if distance_matrix[i, j] < 10.0:  # Real edge (not the 10.0 placeholder)
-                    scale_sum_input += distance_matrix[i, j]
-                    scale_sum_mds += mds_dist_matrix[i, j]
+        input_distances = distance_matrix[np.triu_indices(n_nodes, k=1)]
+        real_edge = input_distances < 10.0  # Not the 10.0 placeholder
+        scale_sum_input = input_distances[real_edge].sum(dtype=float)
+        scale_sum_mds = mds_distances[real_edge].sum()
 
         # Scale factor to make MDS distances match input distances
         if scale_sum_mds > 0:
@@ -591,12 +739,6 @@ class SocialBalanceModel:
         # Now scale by DISTANCE_SCALE (300) to convert to pixels
         coords_2d = coords_2d * 300
 
-        # Compute PCA on high-dim MDS for variance analysis
-        mds_highd = MDS(n_components=min(n_nodes - 1, 5), dissimilarity='precomputed', random_state=42)
-        coords_high_dim = mds_highd.fit_transform(distance_matrix)
-        pca = PCA()
-        pca.fit(coords_high_dim)
-
         # Update nodes with MDS positions
         nodes_list = []
         for person_id, node_data in nodes_dict.items():
@@ -605,9 +747,13 @@ class SocialBalanceModel:
             node_data["y"] = float(coords_2d[idx, 1])
             nodes_list.append(node_data)
 
-        # Calculate variance explained by first 5 PCs
-        variance_explained = (pca.explained_variance_ratio_ * 100).tolist()[:5]
-        variance_explained = [round(v, 1) for v in variance_explained]
+        # Variance explained by the first 5 principal axes: classical MDS axes are
+        # already principal components, with variances proportional to the eigenvalues
+        spectrum = eigenvalues[:n_spectrum]
+        if spectrum.sum() > 0:
+            variance_explained = (spectrum / spectrum.sum() * 100).round(1).tolist()
+        else:
+            variance_explained = []
 
         # Pad with zeros if less than 5 components
         while len(variance_explained) < 5:
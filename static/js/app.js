@@ -4,7 +4,7 @@ let svg;
 let width, height;
 let nodesGroup, linksGroup, linkLabelsGroup;
 let currentSimulationId = null;
-let pollingInterval = null;
+let simulationEvents = null;
 
 // Initialize the application
 document.addEventListener('DOMContentLoaded', () => {
@@ -618,10 +618,8 @@ async function runSimulation() {
         document.getElementById('run-btn').style.display = 'none';
         document.getElementById('stop-btn').style.display = 'block';
 
-        // Poll for progress
-        pollingInterval = setInterval(async () => {
-            await checkSimulationStatus();
-        }, 500); // Check every 500ms
+        // Receive progress pushed by the server
+        subscribeSimulationEvents();
 
     } catch (error) {
         showStatus('Error starting simulation: ' + error.message, 'error');
@@ -630,13 +628,55 @@ async function runSimulation() {
     }
 }
 
+function subscribeSimulationEvents() {
+    simulationEvents = new EventSource(`/api/simulate/events/${currentSimulationId}`);
+    simulationEvents.onmessage = async (event) => {
+        const data = JSON.parse(event.data);
+        if (data.status !== 'running') {
+            // Final snapshot - the server closes the stream after this
+            closeSimulationEvents();
+        }
+        await handleSimulationStatus(data);
+    };
+    simulationEvents.onerror = async () => {
+        // Stream dropped - check the status, and subscribe again while it is still running
+        closeSimulationEvents();
+        const data = await checkSimulationStatus();
+        if (data && data.status === 'running') {
+            setTimeout(() => {
+                if (currentSimulationId && !simulationEvents) {
+                    subscribeSimulationEvents();
+                }
+            }, 1000);
+        }
+    };
+}
+
+function closeSimulationEvents() {
+    if (simulationEvents) {
+        simulationEvents.close();
+        simulationEvents = null;
+    }
+}
+
 async function checkSimulationStatus() {
     if (!currentSimulationId) return;
 
     try {
         const response = await fetch(`/api/simulate/status/${currentSimulationId}`);
         const data = await response.json();
+        await handleSimulationStatus(data);
+        return data;
+    } catch (error) {
+        console.error('Error checking simulation status:', error);
+        return null;
+    }
+}
 
+async function handleSimulationStatus(data) {
+    if (!currentSimulationId) return;
+
+    try {
         // Update progress bar
         const progress = (data.current_iteration / data.max_iterations) * 100;
         updateProgress(progress, data.current_iteration, data.max_iterations);
@@ -649,8 +689,7 @@ async function checkSimulationStatus() {
 
         // Check if simulation is complete
         if (data.status === 'completed') {
-            clearInterval(pollingInterval);
-            pollingInterval = null;
+            closeSimulationEvents();
             currentSimulationId = null;
 
             const message = data.result.converged
@@ -667,8 +706,7 @@ async function checkSimulationStatus() {
             document.getElementById('stop-btn').style.display = 'none';
 
         } else if (data.status === 'stopped') {
-            clearInterval(pollingInterval);
-            pollingInterval = null;
+            closeSimulationEvents();
             currentSimulationId = null;
 
             showStatus('Simulation stopped by user', 'info');
@@ -681,8 +719,7 @@ async function checkSimulationStatus() {
             document.getElementById('stop-btn').style.display = 'none';
 
         } else if (data.status === 'timeout') {
-            clearInterval(pollingInterval);
-            pollingInterval = null;
+            closeSimulationEvents();
             currentSimulationId = null;
 
             showStatus('Simulation timed out after 5 minutes', 'error');
@@ -695,8 +732,7 @@ async function checkSimulationStatus() {
             document.getElementById('stop-btn').style.display = 'none';
 
         } else if (data.status === 'error') {
-            clearInterval(pollingInterval);
-            pollingInterval = null;
+            closeSimulationEvents();
             currentSimulationId = null;
 
             showStatus('Simulation error: ' + data.error, 'error');
@@ -708,7 +744,7 @@ async function checkSimulationStatus() {
         }
 
     } catch (error) {
-        console.error('Error checking simulation status:', error);
+        console.error('Error handling simulation status:', error);
     }
 }
 
@@ -34,6 +34,13 @@ def test_model_configs():
         except Exception as e:
             print(f"   ✗ FAILED: {e}\n")
 
+    # A seeded model and its components share one generator, so runs repeat
+    from social_balance import SocialBalanceModel
+    first, second = (SocialBalanceModel(None, **ModelFactory.create_from_config(PRESET_CONFIGS["bipolar_weighted"]),
+                                        seed=3) for _ in range(2))
+    assert first.action_strategy.rng is first.rng and first.relationship_type.rng is first.rng
+    assert first.relationship_type.get_random_values(5).tolist() == second.relationship_type.get_random_values(5).tolist()
+
     print("All model configuration tests completed!")
 
 
@@ -67,10 +74,35 @@ def test_balance_rules():
     print(f"  [-0.5, -0.5, -0.5]: {product.is_balanced([-0.5, -0.5, -0.5])}")
 
 
+def test_balance_rules_batch():
+    """Test that batched balance checks agree with the per-triangle rule."""
+    print("\nTesting batched balance rules:\n")
+
+    import numpy as np
+    from models.balance_rules import (ClassicBalanceRule, TransitivityBalanceRule, StrictPositiveBalanceRule,
+                                      TriangleInequalityRule, ProductBalanceRule)
+
+    triangles = [[1, 1, 1], [1, -1, -1], [1, 1, -1], [-1, -1, -1], [1, 0, -1],
+                 [0.5, 0.5, 0.9], [0.5, -0.5, -0.5], [0.005, 1, 1]]
+    status = {True: 1, False: 0, None: -1}
+    for rule in (ClassicBalanceRule(), TransitivityBalanceRule(), StrictPositiveBalanceRule(),
+                 TriangleInequalityRule(min_strength=0.1), ProductBalanceRule()):
+        batch = rule.is_balanced_batch(np.array(triangles, dtype=float))
+        print(f"  {rule.get_name()}: {batch.tolist()}")
+        assert batch.dtype == np.int8
+        assert batch.tolist() == [status[rule.is_balanced(t)] for t in triangles]
+
+    # Discrete relationships keep their edge values as int8
+    discrete = np.array([[1, 1, 1], [1, -1, -1], [1, 1, -1], [-1, -1, -1], [1, 0, -1]], dtype=np.int8)
+    assert ClassicBalanceRule().is_balanced_batch(discrete).tolist() == [1, 1, 0, 0, -1]
+    assert TransitivityBalanceRule().is_balanced_batch(discrete).tolist() == [1, 1, 0, 1, -1]
+
+
 def test_relationship_types():
     """Test relationship type encoding/decoding."""
     print("\n\nTesting relationship types:\n")
 
+    import numpy as np
     from models.relationship_types import DiscreteRelationship, ContinuousRelationship, BipolarRelationship
 
     # Discrete
@@ -79,6 +111,13 @@ def test_relationship_types():
     print(f"  Encode 1.0: {discrete.encode_to_storage(1.0)}")
     print(f"  Encode -1.0: {discrete.encode_to_storage(-1.0)}")
     print(f"  Decode 'POSITIVE': {discrete.decode_from_storage('POSITIVE')}")
+    stored = discrete.encode_to_storage_array(np.array([1.0, -1.0, 0.0]))
+    print(f"  Encode array [1, -1, 0]: {stored}")
+    assert stored.dtype == np.int8 and stored.tolist() == [1, -1, 0]
+    assert discrete.decode_from_storage_array(stored).tolist() == [1.0, -1.0, 0.0]
+    loaded = discrete.decode_from_storage_array(np.array(["POSITIVE", 1, "NEUTRAL"], dtype=object))
+    assert loaded.dtype == np.int8 and loaded.tolist() == [1, 1, 0]
+    assert discrete.decode_from_storage_array(np.array([0.5, -1.0])).tolist() == [0.5, -1.0]
 
     # Continuous
     continuous = ContinuousRelationship(min_val=0.0, max_val=1.0)
@@ -86,6 +125,9 @@ def test_relationship_types():
     print(f"  Random value: {continuous.get_random_value()}")
     print(f"  Adjust 0.5 by +0.2: {continuous.adjust_value(0.5, 0.2)}")
     print(f"  Adjust 0.9 by +0.2: {continuous.adjust_value(0.9, 0.2)}")
+    stored = continuous.encode_to_storage_array([0.25, 0.75])
+    assert stored.dtype == np.float32
+    assert np.allclose(continuous.decode_from_storage_array(stored), [0.25, 0.75])
 
     # Bipolar
     bipolar = BipolarRelationship(max_val=1.0)
@@ -93,12 +135,85 @@ def test_relationship_types():
     for _ in range(3):
         val = bipolar.get_random_value()
         print(f"  Random value: {val:.2f}")
+    values = bipolar.get_random_values(1000)
+    assert values.shape == (1000,) and (np.abs(values) >= bipolar.neutral_threshold).all()
+    assert (values < 0).any() and (values > 0).any()
+    assert (bipolar.get_random_negative_values(100) <= -bipolar.neutral_threshold).all()
+    assert 0.0 not in DiscreteRelationship().get_random_values(100, exclude=0.0)
+    tags = bipolar.encode_tags(np.array([0.5, -0.5, 0.001]))
+    assert bipolar.storage_names(tags) == ["POSITIVE", "NEGATIVE", "NEUTRAL"]
+
+
+def test_graph_mirror():
+    """Test triangle enumeration and counts on the in-process graph copy."""
+    print("\n\nTesting graph mirror:\n")
+
+    import numpy as np
+    from graph_mirror import GraphMirror
+
+    graph = GraphMirror(range(4))
+    graph.set_edge(0, 1, "POSITIVE", 1.0)
+    graph.set_edge(1, 2, "POSITIVE", 1.0)
+    graph.set_edge(0, 2, "NEGATIVE", -1.0)
+    graph.set_edge(2, 3, "POSITIVE", 1.0)
+
+    triangles = graph.get_triangles()
+    print(f"  Triangles: {triangles}")
+    print(f"  Relationships: {graph.count_relationships()}")
+    assert [(t["n1"], t["n2"], t["n3"]) for t in triangles] == [(0, 1, 2)]
+    assert sorted((triangles[0]["e1"], triangles[0]["e2"], triangles[0]["e3"])) == [-1.0, 1.0, 1.0]
+    assert graph.count_relationships() == {"POSITIVE": 3, "NEGATIVE": 1}
+
+    batch = graph.get_triangle_batch()
+    rotated = batch.triangle(0, person_id=2)
+    print(f"  Triangle seen from person 2: {rotated}")
+    assert (rotated["n1"], rotated["n2"], rotated["n3"]) == (2, 0, 1)
+    assert (rotated["e1"], rotated["e2"], rotated["e3"]) == (-1.0, 1.0, 1.0)
+    by_person = batch.rows_by_person(np.arange(len(batch)))
+    assert {pid: rows.tolist() for pid, rows in by_person.items()} == {0: [0], 1: [0], 2: [0]}
+
+    graph.apply_changes([{"op": "delete", "person1_id": 0, "person2_id": 2}])
+    print(f"  After deleting 0-2: {len(graph.get_triangles())} triangles")
+    assert graph.get_triangles() == []
+
+    # Bulk edge writes match one set_edge per edge
+    bulk = GraphMirror(range(4))
+    bulk.set_edges([0, 1, 0, 2], [1, 2, 2, 3], ["POSITIVE", "POSITIVE", "NEGATIVE", "POSITIVE"], [1.0, 1.0, -1.0, 1.0])
+    assert bulk.count_relationships() == {"POSITIVE": 3, "NEGATIVE": 1}
+    assert bulk.values[2, 0] == -1.0 and bulk.types[3, 2] == bulk.types[2, 3]
+
+    # Edge ages restart when an edge is set but not when decay updates it, and
+    # stepping hybrid decay by age reaches the power-law tail
+    from models.mechanisms import HybridDecay
+    decay = HybridDecay(time_constant=10.0, t_switch=20.0)
+    bulk.clock = 30
+    bulk.set_edge(0, 1, "POSITIVE", 1.0)
+    bulk.apply_changes([{"op": "update", "person1_id": 1, "person2_id": 2, "rel_type": "POSITIVE", "value": 0.5}],
+                       keep_age=True)
+    _, _, values, ages = bulk.get_edges()
+    print(f"  Edge ages: {ages.tolist()}")
+    assert ages.tolist() == [0, 30, 30, 30]
+    stepped = np.array([1.0, 1.0])
+    for age in range(40):
+        stepped = decay.apply_decay_array(stepped, None, 1, [age, age])
+    assert np.allclose(stepped, decay.retention([40, 40]))
+    assert stepped[0] > np.exp(-4.0)
+
+    # Values loaded from Neo4j records keep their stored float64 precision
+    from models.relationship_types import ContinuousRelationship
+    continuous = ContinuousRelationship()
+    records = [{"p": {"id": 0}, "r": {"type": "POSITIVE", "value": 0.3}, "p2": {"id": 1}},
+               {"p": {"id": 1}, "r": {"type": "POSITIVE", "value": 0.7}, "p2": {"id": 2}}]
+    loaded = GraphMirror.from_records(records, continuous.decode_from_storage_array, continuous.dtype)
+    assert loaded.values[0, 1] == 0.3 and loaded.values[2, 1] == 0.7
 
 
 if __name__ == "__main__":
     test_model_configs()
     test_balance_rules()
+    test_balance_rules_batch()
     test_relationship_types()
+    test_graph_mirror()
     print("\n" + "=" * 60)
     print("All tests completed successfully!")
     print("=" * 60)